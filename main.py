@@ -17,9 +17,10 @@ ROOT = os.path.dirname(os.path.abspath(__file__))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
+# Only the stdlib-only logger module is needed at import time (BANNER uses
+# Colors); everything else is imported once the chosen mode needs it, so
+# `--help` stays cheap.
 from src.logger import setup_logger, get_logger, Colors
-from src.config import load_config, ConfigError
-from src.copier import TradeCopier
 
 BANNER = f"""
 {Colors.CYAN}{Colors.BOLD}
@@ -32,6 +33,10 @@ BANNER = f"""
 {Colors.RESET}{Colors.GREY}  MT5 Multi-Account Trade Copier  |  github.com/HR363/trade-copier{Colors.RESET}
 """
 
+# Static colored tags for the connection check
+_OK_TAG   = f"{Colors.GREEN}OK{Colors.RESET}"
+_FAIL_TAG = f"{Colors.RED}FAILED{Colors.RESET}"
+
 
 def main():
     parser = argparse.ArgumentParser(description="MT5 Trade Copier")
@@ -58,6 +63,9 @@ def main():
     )
     args = parser.parse_args()
 
+    from src.config import load_config, ConfigError
+    from src.models import LotMode
+
     # --- Load config first so we can read its log level ---
     try:
         master_config, slave_configs, settings = load_config(args.config)
@@ -79,30 +87,33 @@ def main():
     active_slaves = [s for s in slave_configs if s.enabled]
     disabled_slaves = [s for s in slave_configs if not s.enabled]
 
-    logger.info(f"Config loaded: {args.config}")
-    logger.info(
+    # One record for the whole account listing instead of one per slave
+    lines = [
+        f"Config loaded: {args.config}",
         f"Master : {Colors.CYAN}{master_config.name}{Colors.RESET} "
-        f"(login {master_config.login} @ {master_config.server})"
-    )
+        f"(login {master_config.login} @ {master_config.server})",
+    ]
     for s in active_slaves:
         lot_desc = (
             f"fixed {s.lot_value} lot"
-            if s.lot_mode.value == "fixed"
+            if s.lot_mode is LotMode.FIXED
             else f"{s.lot_value}x multiplier"
         )
-        logger.info(
+        lines.append(
             f"Slave  : {Colors.CYAN}{s.name}{Colors.RESET} "
             f"(login {s.login} @ {s.server})  [{lot_desc}]"
         )
-    for s in disabled_slaves:
-        logger.info(f"Slave  : {Colors.GREY}{s.name} (DISABLED){Colors.RESET}")
-
-    logger.info(
+    lines.extend(
+        f"Slave  : {Colors.GREY}{s.name} (DISABLED){Colors.RESET}"
+        for s in disabled_slaves
+    )
+    lines.append(
         f"Settings: poll={settings['poll_interval_ms']}ms  "
         f"copy_sl={settings['copy_stop_loss']}  "
         f"copy_tp={settings['copy_take_profit']}  "
         f"pending={settings['copy_pending_orders']}"
     )
+    logger.info("\n".join(lines))
 
     # --- Connection check mode ---
     if args.check:
@@ -122,6 +133,8 @@ def main():
 
     # --- Launch UI (default) or headless mode ---
     if args.headless:
+        from src.copier import TradeCopier
+
         copier = TradeCopier(
             master_config=master_config,
             slave_configs=slave_configs,
@@ -157,7 +170,7 @@ def _launch_ui(master_config, slave_configs, settings, config_path):
 
 def _run_connection_check(master_config, slave_configs):
     """Test connections to all accounts and report status."""
-    from src.mt5_connector import MT5Connector
+    from src.mt5_connector import registry
 
     logger = get_logger()
     logger.info("─" * 50)
@@ -165,29 +178,32 @@ def _run_connection_check(master_config, slave_configs):
 
     all_ok = True
 
-    for config in [master_config] + slave_configs:
-        label = "MASTER" if config is master_config else "SLAVE "
-        connector = MT5Connector(config)
-        try:
-            ok = connector.connect(timeout_ms=10_000)
-            if ok:
-                try:
-                    import MetaTrader5 as mt5
-                    info = mt5.account_info()
-                    if info:
-                        logger.info(
-                            f"[{label}] {Colors.GREEN}OK{Colors.RESET}  "
-                            f"{config.name} — balance {info.balance:.2f} {info.currency}"
-                        )
-                    else:
-                        logger.warning(f"[{label}] Connected but no account info")
-                except Exception:
-                    logger.info(f"[{label}] {Colors.GREEN}OK{Colors.RESET}  {config.name}")
-            else:
-                logger.error(f"[{label}] {Colors.RED}FAILED{Colors.RESET}  {config.name}")
-                all_ok = False
-        finally:
-            connector.shutdown()
+    try:
+        for config in [master_config] + slave_configs:
+            label = "MASTER" if config is master_config else "SLAVE "
+            # Registry connector: connecting the next account releases this
+            # one's binding, close_all() below releases the last
+            connector = registry.get(config)
+            with connector.lock:
+                ok = connector.connect(timeout_ms=10_000)
+                if ok:
+                    try:
+                        import MetaTrader5 as mt5
+                        info = mt5.account_info()
+                        if info:
+                            logger.info(
+                                f"[{label}] {_OK_TAG}  "
+                                f"{config.name} — balance {info.balance:.2f} {info.currency}"
+                            )
+                        else:
+                            logger.warning(f"[{label}] Connected but no account info")
+                    except Exception:
+                        logger.info(f"[{label}] {_OK_TAG}  {config.name}")
+                else:
+                    logger.error(f"[{label}] {_FAIL_TAG}  {config.name}")
+                    all_ok = False
+    finally:
+        registry.close_all()
 
     logger.info("─" * 50)
     if all_ok:
@@ -5,9 +5,22 @@ Reads and validates accounts.json.
 
 import json
 import os
+from operator import itemgetter
 from typing import Tuple, List
 from src.models import AccountConfig, LotMode
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+
+_REQUIRED = frozenset(("login", "password", "server", "terminal_path"))
+_GET_REQUIRED = itemgetter("login", "password", "server", "terminal_path")
+
 
 class ConfigError(Exception):
     pass
@@ -23,24 +36,35 @@ def load_config(config_path: str) -> Tuple[AccountConfig, List[AccountConfig], d
     if not os.path.exists(config_path):
         raise ConfigError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        try:
-            raw = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ConfigError(f"Invalid JSON in config file: {e}")
+    # Read bytes and parse in one call: orjson when installed, stdlib otherwise
+    with open(config_path, "rb") as f:
+        data = f.read()
+    try:
+        raw = _loads(data)
+    except _JSONDecodeError as e:
+        raise ConfigError(f"Invalid JSON in config file: {e}")
+    return parse_config(raw)
+
 
+def parse_config(raw: dict) -> Tuple[AccountConfig, List[AccountConfig], dict]:
+    """
+    Validate an already-parsed config (the accounts.json layout).
+
+    Returns:
+        (master_config, slave_configs, settings)
+    """
     # --- Parse master ---
     if "master" not in raw:
         raise ConfigError("Config must have a 'master' section.")
 
     master_raw = raw["master"]
-    _validate_account_fields(master_raw, "master")
+    login, password, server, terminal_path = _validate_account_fields(master_raw, "master")
     master = AccountConfig(
         name=master_raw.get("name", "Master"),
-        login=int(master_raw["login"]),
-        password=str(master_raw["password"]),
-        server=master_raw["server"],
-        terminal_path=master_raw["terminal_path"],
+        login=int(login),
+        password=str(password),
+        server=server,
+        terminal_path=terminal_path,
         comment=master_raw.get("comment", ""),
     )
 
@@ -51,7 +75,7 @@ def load_config(config_path: str) -> Tuple[AccountConfig, List[AccountConfig], d
     slaves: List[AccountConfig] = []
     for i, s in enumerate(raw["slaves"]):
         label = f"slaves[{i}]"
-        _validate_account_fields(s, label)
+        login, password, server, terminal_path = _validate_account_fields(s, label)
 
         lot_mode_str = s.get("lot_mode", "multiplier").lower()
         try:
@@ -67,10 +91,10 @@ def load_config(config_path: str) -> Tuple[AccountConfig, List[AccountConfig], d
 
         slaves.append(AccountConfig(
             name=s.get("name", f"Slave {i + 1}"),
-            login=int(s["login"]),
-            password=str(s["password"]),
-            server=s["server"],
-            terminal_path=s["terminal_path"],
+            login=int(login),
+            password=str(password),
+            server=server,
+            terminal_path=terminal_path,
             enabled=bool(s.get("enabled", True)),
             lot_mode=lot_mode,
             lot_value=lot_value,
@@ -96,8 +120,10 @@ def load_config(config_path: str) -> Tuple[AccountConfig, List[AccountConfig], d
     return master, slaves, settings
 
 
-def _validate_account_fields(data: dict, label: str):
-    required = ["login", "password", "server", "terminal_path"]
-    for field in required:
-        if field not in data:
-            raise ConfigError(f"'{label}' is missing required field: '{field}'")
+def _validate_account_fields(data: dict, label: str) -> tuple:
+    """Check the required fields; return (login, password, server, terminal_path)."""
+    missing = _REQUIRED - data.keys()
+    if missing:
+        fields = ", ".join(f"'{f}'" for f in sorted(missing))
+        raise ConfigError(f"'{label}' is missing required field(s): {fields}")
+    return _GET_REQUIRED(data)
@@ -4,29 +4,69 @@ Polls the master account for position changes and replicates them to all
 enabled slave accounts.
 """
 
+import logging
+import threading
 import time
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from src.models import (
-    AccountConfig, CopySignal, CopyResult, CopyStatus,
-    SignalType,
+    AccountConfig, CopySignal, CopyResult,
+    CopyStatus, Position, SignalType,
 )
-from src.mt5_connector import MT5Connector, ConnectorError
 from src.tracker import PositionTracker
 from src.logger import get_logger
 
+if TYPE_CHECKING:
+    # Imported lazily in start(): pulling in MetaTrader5 (and numpy) is only
+    # worth it once the copier actually runs.
+    from src.mt5_connector import MT5Connector, MultiConnectorPool
+
 logger = get_logger()
 
+# extra= for signal / result lines, so the UI needn't sniff the text for a tag
+_SIGNAL_EXTRA = {t: {"tag": t.value} for t in SignalType}
+_RESULT_EXTRA = {
+    CopyStatus.SUCCESS: {"tag": "slave_ok"},
+    CopyStatus.FAILED:  {"tag": "slave_fail"},
+    CopyStatus.SKIPPED: {"tag": "skipped"},
+}
+
+# Longest the poll interval may stretch to while the master is quiet (seconds)
+_MAX_IDLE_INTERVAL = 2.0
+
+
+def _dedupe_signals(signals: List[CopySignal]) -> List[CopySignal]:
+    """
+    Drop repeated signals for the same ticket and SL/TP (rounded to 5
+    decimals) so a noisy master doesn't cost every slave an extra round-trip.
+    """
+    seen = set()
+    unique = []
+    for sig in signals:
+        key = (
+            sig.signal_type, sig.master_ticket,
+            round(sig.stop_loss, 5), round(sig.take_profit, 5),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(sig)
+    return unique
+
 
 class TradeCopier:
     """
     The main copy engine.
 
     Workflow per cycle:
-      1. Connect to master  → get positions → disconnect
+      1. Attach to master (reusing the live connection) → get positions
       2. Diff against previous snapshot → produce signals
       3. For each slave:
-           connect → handle signals → disconnect
+           attach → handle signals
+
+    Connectors are opened once in start() and kept for the whole session;
+    a connector is only re-initialized after it failed or another account
+    took over the terminal binding.
     """
 
     def __init__(
@@ -47,8 +87,15 @@ class TradeCopier:
 
         self._tracker       = PositionTracker()
         self._running       = False
+        self._stop_event    = threading.Event()
+        self._idle_cycles   = 0     # consecutive cycles without signals
+
+        # Persistent connectors (created in start())
+        self._master_conn: Optional["MT5Connector"] = None
+        self._slaves: Optional["MultiConnectorPool"] = None
 
-        # Stats
+        # Stats (updated from the slave worker threads)
+        self._stats_lock    = threading.Lock()
         self.total_opens    = 0
         self.total_closes   = 0
         self.total_modifies = 0
@@ -69,32 +116,66 @@ class TradeCopier:
         )
         self._print_separator()
 
+        from src.mt5_connector import MultiConnectorPool, registry
+
+        self._master_conn = registry.get(self.master_config)
+        self._slaves = MultiConnectorPool(self.slave_configs)
+
+        self._stop_event.clear()
+        self._idle_cycles = 0
+
         try:
+            # Bring the master up with a few retries before the first cycle;
+            # later cycles reconnect with a single attempt each
+            with self._master_conn.lock:
+                self._master_conn.connect(max_attempts=3)
+
             while self._running:
                 cycle_start = time.monotonic()
-                self._run_cycle()
+                if self._run_cycle():
+                    self._idle_cycles = 0
+                else:
+                    self._idle_cycles += 1
                 elapsed = time.monotonic() - cycle_start
-                sleep_time = max(0.0, self.poll_interval - elapsed)
-                time.sleep(sleep_time)
+                sleep_time = max(0.0, self._current_interval() - elapsed)
+                self._stop_event.wait(sleep_time)
         except KeyboardInterrupt:
             logger.info("Shutting down Trade Copier…")
         finally:
             self._running = False
+            self.close_all()
             self._print_summary()
 
     def stop(self):
         self._running = False
+        self._stop_event.set()
+
+    def close_all(self):
+        """Shut down every persistent connector."""
+        if self._slaves is not None:
+            self._slaves.close_all()
+        if self._master_conn is not None:
+            self._master_conn.shutdown()
 
     # ------------------------------------------------------------------
     # Internal cycle
     # ------------------------------------------------------------------
 
-    def _run_cycle(self):
-        """One full poll+copy cycle."""
+    def _current_interval(self) -> float:
+        """
+        Poll interval for the next cycle: the configured value right after
+        activity, doubling per idle cycle (up to 8x) but never beyond
+        _MAX_IDLE_INTERVAL unless the configured interval is already longer.
+        """
+        backoff = self.poll_interval * (1 << min(self._idle_cycles, 3))
+        return min(backoff, max(self.poll_interval, _MAX_IDLE_INTERVAL))
+
+    def _run_cycle(self) -> bool:
+        """One full poll+copy cycle. Returns True if any signal was copied."""
         # Step 1: Poll master
         master_positions = self._poll_master()
         if master_positions is None:
-            return  # connection error, skip this cycle
+            return False  # connection error, skip this cycle
 
         # Step 2: Compute what changed
         signals = self._tracker.compute_signals(
@@ -104,91 +185,121 @@ class TradeCopier:
         )
 
         if not signals:
-            return  # nothing to do
+            return False  # nothing to do
+        if len(signals) > 1:
+            signals = _dedupe_signals(signals)
 
-        # Step 3: Propagate to each slave
         for signal in signals:
             self._log_signal(signal)
-            for slave_config in self.slave_configs:
-                result = self._apply_signal_to_slave(signal, slave_config)
+
+        # Step 3: Propagate to every slave concurrently, one batch per slave
+        for results in self._slaves.broadcast(self._sync_slave, signals):
+            for result in results:
                 self._log_result(result)
 
+        return True
+
     # ------------------------------------------------------------------
     # Master polling
     # ------------------------------------------------------------------
 
     def _poll_master(self):
-        """Connect to master, grab positions, disconnect. Returns None on error."""
-        connector = MT5Connector(self.master_config)
-        try:
-            if not connector.connect():
-                logger.error(f"Could not connect to master '{self.master_config.name}'")
+        """Grab master positions over the persistent connection. Returns None on error."""
+        connector = self._master_conn
+        with connector.lock:
+            try:
+                if not connector.connect():
+                    logger.error(f"Could not connect to master '{self.master_config.name}'")
+                    return None
+                # A full snapshot rather than a history_deals_get() delta:
+                # SL/TP edits create no deal, so a deals-only poll would
+                # silently miss MODIFY signals.
+                return connector.get_positions()
+            except Exception as e:
+                logger.error(f"Unexpected error reading master: {e}")
+                # Drop the connection so the next cycle re-initializes it
+                connector.shutdown()
                 return None
-            positions = connector.get_positions()
-            return positions
-        except Exception as e:
-            logger.error(f"Unexpected error reading master: {e}")
-            return None
-        finally:
-            connector.shutdown()
 
     # ------------------------------------------------------------------
     # Signal application
     # ------------------------------------------------------------------
 
+    def _sync_slave(
+        self,
+        connector: "MT5Connector",
+        signals: List[CopySignal],
+    ) -> List[CopyResult]:
+        """
+        Apply every signal of this cycle to one slave.
+        The slave's copied positions are read once and shared by all
+        CLOSE/MODIFY signals instead of being re-fetched per signal.
+        """
+        slave_config = connector.config
+        with connector.lock:
+            copied_positions = None
+            needs_lookup = any(s.signal_type != SignalType.OPEN for s in signals)
+            if needs_lookup and connector.connect():
+                try:
+                    copied_positions = connector.get_copied_positions()
+                except Exception as e:
+                    # Fall back to a per-signal lookup, which reports the failure
+                    logger.debug(f"[{slave_config.name}] Could not read positions: {e}")
+
+            return [
+                self._apply_signal_to_slave(signal, slave_config, copied_positions)
+                for signal in signals
+            ]
+
     def _apply_signal_to_slave(
         self,
         signal: CopySignal,
         slave_config: AccountConfig,
+        copied_positions: Optional[Dict[int, Position]] = None,
     ) -> CopyResult:
-        """Connect to a slave account and execute the signal."""
-        connector = MT5Connector(slave_config)
-        try:
-            if not connector.connect():
-                return CopyResult(
-                    slave_name=slave_config.name,
-                    slave_login=slave_config.login,
-                    signal=signal,
-                    status=CopyStatus.FAILED,
-                    error_message="Could not connect to slave terminal",
-                )
-
-            if signal.signal_type == SignalType.OPEN:
-                return self._handle_open(signal, slave_config, connector)
-
-            elif signal.signal_type == SignalType.CLOSE:
-                return self._handle_close(signal, slave_config, connector)
-
-            elif signal.signal_type == SignalType.MODIFY:
-                return self._handle_modify(signal, slave_config, connector)
-
-        except Exception as e:
-            logger.error(f"[{slave_config.name}] Unexpected error: {e}")
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.FAILED,
-                error_message=str(e),
-            )
-        finally:
-            connector.shutdown()
+        """
+        Attach to a slave account and execute the signal.
+        `copied_positions` is the slave's get_copied_positions() result when
+        the caller already has it; otherwise it is fetched on demand.
+        """
+        connector = self._slaves[slave_config.login]
+        with connector.lock:
+            try:
+                if not connector.connect():
+                    return CopyResult.fail(
+                        slave_config, signal, "Could not connect to slave terminal"
+                    )
+
+                if signal.signal_type == SignalType.OPEN:
+                    return self._handle_open(signal, slave_config, connector)
+
+                elif signal.signal_type == SignalType.CLOSE:
+                    return self._handle_close(
+                        signal, slave_config, connector, copied_positions
+                    )
+
+                elif signal.signal_type == SignalType.MODIFY:
+                    return self._handle_modify(
+                        signal, slave_config, connector, copied_positions
+                    )
+
+            except Exception as e:
+                logger.error(f"[{slave_config.name}] Unexpected error: {e}")
+                connector.shutdown()
+                return CopyResult.fail(slave_config, signal, str(e))
 
     def _handle_open(
         self,
         signal: CopySignal,
         slave_config: AccountConfig,
-        connector: MT5Connector,
+        connector: "MT5Connector",
     ) -> CopyResult:
         """Open a new position on the slave."""
         slave_lot = slave_config.calculate_lot(signal.volume)
         if slave_lot <= 0:
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.SKIPPED,
-                error_message=f"Calculated lot size is {slave_lot} (≤ 0), skipping",
+            return CopyResult.skip(
+                slave_config, signal,
+                f"Calculated lot size is {slave_lot} (≤ 0), skipping",
             )
 
         ticket = connector.open_position(
@@ -201,42 +312,31 @@ class TradeCopier:
         )
 
         if ticket is not None:
-            self.total_opens += 1
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.SUCCESS,
-                slave_ticket=ticket,
-            )
+            with self._stats_lock:
+                self.total_opens += 1
+            return CopyResult.ok(slave_config, signal, ticket)
         else:
-            self.total_errors += 1
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.FAILED,
-                error_message="open_position returned None",
-            )
+            with self._stats_lock:
+                self.total_errors += 1
+            return CopyResult.fail(slave_config, signal, "open_position returned None")
 
     def _handle_close(
         self,
         signal: CopySignal,
         slave_config: AccountConfig,
-        connector: MT5Connector,
+        connector: "MT5Connector",
+        copied_positions: Optional[Dict[int, Position]] = None,
     ) -> CopyResult:
         """Close the corresponding slave position."""
-        copied_positions = connector.get_copied_positions()
+        if copied_positions is None:
+            copied_positions = connector.get_copied_positions()
         slave_pos = copied_positions.get(signal.master_ticket)
 
         if slave_pos is None:
             # Position not found — might have been closed manually
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.SKIPPED,
-                error_message=f"No copied position found for master ticket {signal.master_ticket}",
+            return CopyResult.skip(
+                slave_config, signal,
+                f"No copied position found for master ticket {signal.master_ticket}",
             )
 
         ok = connector.close_position(
@@ -246,41 +346,30 @@ class TradeCopier:
         )
 
         if ok:
-            self.total_closes += 1
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.SUCCESS,
-                slave_ticket=slave_pos.ticket,
-            )
+            with self._stats_lock:
+                self.total_closes += 1
+            return CopyResult.ok(slave_config, signal, slave_pos.ticket)
         else:
-            self.total_errors += 1
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.FAILED,
-                error_message="close_position returned False",
-            )
+            with self._stats_lock:
+                self.total_errors += 1
+            return CopyResult.fail(slave_config, signal, "close_position returned False")
 
     def _handle_modify(
         self,
         signal: CopySignal,
         slave_config: AccountConfig,
-        connector: MT5Connector,
+        connector: "MT5Connector",
+        copied_positions: Optional[Dict[int, Position]] = None,
     ) -> CopyResult:
         """Modify SL/TP on the corresponding slave position."""
-        copied_positions = connector.get_copied_positions()
+        if copied_positions is None:
+            copied_positions = connector.get_copied_positions()
         slave_pos = copied_positions.get(signal.master_ticket)
 
         if slave_pos is None:
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.SKIPPED,
-                error_message=f"No copied position found for master ticket {signal.master_ticket}",
+            return CopyResult.skip(
+                slave_config, signal,
+                f"No copied position found for master ticket {signal.master_ticket}",
             )
 
         ok = connector.modify_position(
@@ -290,60 +379,59 @@ class TradeCopier:
         )
 
         if ok:
-            self.total_modifies += 1
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.SUCCESS,
-                slave_ticket=slave_pos.ticket,
-            )
+            with self._stats_lock:
+                self.total_modifies += 1
+            return CopyResult.ok(slave_config, signal, slave_pos.ticket)
         else:
-            self.total_errors += 1
-            return CopyResult(
-                slave_name=slave_config.name,
-                slave_login=slave_config.login,
-                signal=signal,
-                status=CopyStatus.FAILED,
-                error_message="modify_position returned False",
-            )
+            with self._stats_lock:
+                self.total_errors += 1
+            return CopyResult.fail(slave_config, signal, "modify_position returned False")
 
     # ------------------------------------------------------------------
     # Logging helpers
     # ------------------------------------------------------------------
 
     def _log_signal(self, signal: CopySignal):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         action = signal.signal_type.value.upper()
+        extra = _SIGNAL_EXTRA[signal.signal_type]
         if signal.signal_type == SignalType.OPEN:
             logger.info(
-                f"[MASTER] {action} {signal.symbol}  "
-                f"{signal.order_type.name}  "
-                f"lot={signal.volume:.2f}  "
-                f"sl={signal.stop_loss}  tp={signal.take_profit}  "
-                f"ticket={signal.master_ticket}"
+                "[MASTER] %s %s  %s  lot=%.2f  sl=%s  tp=%s  ticket=%s",
+                action, signal.symbol, signal.order_type.name, signal.volume,
+                signal.stop_loss, signal.take_profit, signal.master_ticket,
+                extra=extra,
             )
         elif signal.signal_type == SignalType.CLOSE:
             logger.info(
-                f"[MASTER] {action} {signal.symbol}  ticket={signal.master_ticket}"
+                "[MASTER] %s %s  ticket=%s",
+                action, signal.symbol, signal.master_ticket,
+                extra=extra,
             )
         elif signal.signal_type == SignalType.MODIFY:
             logger.info(
-                f"[MASTER] {action} {signal.symbol}  "
-                f"sl={signal.stop_loss}  tp={signal.take_profit}  "
-                f"ticket={signal.master_ticket}"
+                "[MASTER] %s %s  sl=%s  tp=%s  ticket=%s",
+                action, signal.symbol, signal.stop_loss, signal.take_profit,
+                signal.master_ticket,
+                extra=extra,
             )
 
     def _log_result(self, result: CopyResult):
-        status = result.status.value.upper()
-        base = (
-            f"  → [{result.slave_name}] {result.signal.signal_type.value.upper()} "
-            f"{result.signal.symbol}  {status}"
-        )
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        fmt = "  → [%s] %s %s  %s"
+        args = [
+            result.slave_name, result.signal.signal_type.value.upper(),
+            result.signal.symbol, result.status.value.upper(),
+        ]
         if result.slave_ticket:
-            base += f"  slave_ticket={result.slave_ticket}"
+            fmt += "  slave_ticket=%s"
+            args.append(result.slave_ticket)
         if result.error_message:
-            base += f"  ({result.error_message})"
-        logger.info(base)
+            fmt += "  (%s)"
+            args.append(result.error_message)
+        logger.info(fmt, *args, extra=_RESULT_EXTRA.get(result.status))
 
     def _print_separator(self):
         logger.info("─" * 70)
@@ -3,8 +3,9 @@ Colored console logger for the Trade Copier.
 """
 
 import logging
+import re
 import sys
-from datetime import datetime
+import time
 
 
 # ANSI color codes
@@ -30,36 +31,82 @@ LEVEL_COLORS = {
 }
 
 
-class ColorFormatter(logging.Formatter):
+# Keywords highlighted in messages, matched in one pass by _KEYWORD_RE
+_KEYWORD_COLORS = {
+    "OPENED":   Colors.GREEN,
+    "CLOSED":   Colors.RED,
+    "MODIFIED": Colors.CYAN,
+    "SUCCESS":  Colors.GREEN,
+    "FAILED":   Colors.RED,
+    "SKIPPED":  Colors.GREY,
+}
+_KEYWORD_RE = re.compile("|".join(_KEYWORD_COLORS))
+_KEYWORD_SUBS = {kw: f"{color}{kw}{Colors.RESET}" for kw, color in _KEYWORD_COLORS.items()}
+
+
+# UI highlight keys a record may name via extra={"tag": key}; records
+# without one are tagged by matching their text instead
+LOG_TAG_KEYS = ("open", "close", "modify", "master", "slave_ok", "slave_fail", "skipped")
+
+
+def _highlight(match: "re.Match") -> str:
+    return _KEYWORD_SUBS[match.group(0)]
+
+
+class _ClockFormatter(logging.Formatter):
+    """Base formatter with a cheap HH:MM:SS.mmm timestamp."""
+
+    def __init__(self):
+        super().__init__()
+        # Records arrive many per second: only re-run strftime when the second changes
+        self._last_sec = -1
+        self._last_str = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._last_sec = sec
+        return f"{self._last_str}.{int(record.msecs):03d}"
+
+
+class PlainFormatter(_ClockFormatter):
+    """Uncolored output, used when stdout is redirected to a file or pipe."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{self._timestamp(record)} [{record.levelname[:4]}] {record.getMessage()}"
+
+
+class ColorFormatter(_ClockFormatter):
     def format(self, record: logging.LogRecord) -> str:
         color = LEVEL_COLORS.get(record.levelname, Colors.WHITE)
-        ts = datetime.fromtimestamp(record.created).strftime("%H:%M:%S.%f")[:-3]
 
         # Color specific parts of the message
         level_tag = f"{color}[{record.levelname[:4]}]{Colors.RESET}"
-        time_tag  = f"{Colors.GREY}{ts}{Colors.RESET}"
-        msg       = record.getMessage()
+        time_tag  = f"{Colors.GREY}{self._timestamp(record)}{Colors.RESET}"
 
         # Highlight keywords
-        msg = msg.replace("OPENED",   f"{Colors.GREEN}OPENED{Colors.RESET}")
-        msg = msg.replace("CLOSED",   f"{Colors.RED}CLOSED{Colors.RESET}")
-        msg = msg.replace("MODIFIED", f"{Colors.CYAN}MODIFIED{Colors.RESET}")
-        msg = msg.replace("SUCCESS",  f"{Colors.GREEN}SUCCESS{Colors.RESET}")
-        msg = msg.replace("FAILED",   f"{Colors.RED}FAILED{Colors.RESET}")
-        msg = msg.replace("SKIPPED",  f"{Colors.GREY}SKIPPED{Colors.RESET}")
+        msg = _KEYWORD_RE.sub(_highlight, record.getMessage())
 
         return f"{time_tag} {level_tag} {msg}"
 
 
 def setup_logger(name: str = "trade_copier", level: str = "INFO") -> logging.Logger:
-    """Create and return a configured logger with color output."""
+    """
+    Create and return a configured logger.
+    Output is colored on a terminal and plain when stdout is redirected.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(ColorFormatter())
+        stream = sys.stdout
+        is_tty = stream is not None and stream.isatty()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(ColorFormatter() if is_tty else PlainFormatter())
         logger.addHandler(handler)
+    # Our handlers are the only output; don't hand every record to root too
+    logger.propagate = False
 
     return logger
 
@@ -2,10 +2,17 @@
 Data models for the Trade Copier.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from enum import Enum
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain dataclasses.
+# The models are deliberately not frozen: frozen dataclasses set every field
+# through object.__setattr__, which makes construction ~3x slower, and
+# Positions are built for every row on every poll.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class OrderType(Enum):
     BUY = 0
@@ -47,7 +54,7 @@ class CopyStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS)
 class Position:
     """Snapshot of an open market position."""
     ticket: int
@@ -62,26 +69,53 @@ class Position:
     profit: float
     swap: float
     open_time: int             # unix timestamp
+    master_ticket: Optional[int] = None  # parsed from an 'MC-<ticket>' comment
+    point: float = 0.0         # symbol price step; 0 when unknown
+    sl_points: int = field(init=False, repr=False)
+    tp_points: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # SL/TP in whole price steps, so change detection is an int compare
+        # at the symbol's own precision (1e-6 steps when the point is unknown)
+        scale = 1.0 / self.point if self.point > 0 else 1_000_000
+        self.sl_points = round(self.stop_loss * scale)
+        self.tp_points = round(self.take_profit * scale)
+
+    def signature(self) -> Tuple[int, float, int, int, float]:
+        """
+        The tradeable fields as one comparable tuple:
+        (ticket, volume, sl_points, tp_points, point).
+        The point is part of it because sl/tp_points taken at different
+        scales (e.g. before and after the point became known) don't compare.
+        """
+        return (self.ticket, self.volume, self.sl_points, self.tp_points, self.point)
 
     def __eq__(self, other: "Position") -> bool:
         """Two positions are equal if all tradeable fields match."""
         if not isinstance(other, Position):
             return False
+        return self.signature() == other.signature()
+
+    def __hash__(self) -> int:
+        return hash(self.signature())
+
+    def sl_tp_changes(self, other: "Position") -> Tuple[bool, bool]:
+        """(sl_changed, tp_changed) against an earlier snapshot of the position."""
+        if self.point == other.point:
+            return self.sl_points != other.sl_points, self.tp_points != other.tp_points
+        # Steps at different scales: compare the prices to within half of
+        # the coarser step, so sub-point noise isn't a change
+        tol = max(self.point, other.point) / 2
         return (
-            self.ticket == other.ticket
-            and self.volume == other.volume
-            and abs(self.stop_loss - other.stop_loss) < 0.000001
-            and abs(self.take_profit - other.take_profit) < 0.000001
+            abs(self.stop_loss - other.stop_loss) >= tol,
+            abs(self.take_profit - other.take_profit) >= tol,
         )
 
     def has_sl_tp_changed(self, other: "Position") -> bool:
-        return (
-            abs(self.stop_loss - other.stop_loss) > 0.000001
-            or abs(self.take_profit - other.take_profit) > 0.000001
-        )
+        return any(self.sl_tp_changes(other))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CopySignal:
     """Instruction to copy a trade action to a slave account."""
     signal_type: SignalType
@@ -100,7 +134,7 @@ class CopySignal:
         return f"MC-{self.master_ticket}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AccountConfig:
     """Configuration for a single MT5 account."""
     name: str
@@ -115,13 +149,13 @@ class AccountConfig:
 
     def calculate_lot(self, master_lot: float) -> float:
         """Calculate the slave lot size based on the master lot."""
-        if self.lot_mode == LotMode.FIXED:
+        # lot_mode is read per call, so an edited config can't keep a stale mode
+        if self.lot_mode is LotMode.FIXED:
             return round(self.lot_value, 2)
-        else:  # MULTIPLIER
-            return round(master_lot * self.lot_value, 2)
+        return round(master_lot * self.lot_value, 2)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CopyResult:
     """Result of a copy operation on one slave account."""
     slave_name: str
@@ -130,3 +164,16 @@ class CopyResult:
     status: CopyStatus
     slave_ticket: Optional[int] = None
     error_message: str = ""
+
+    # Positional factories for the copier's hot path
+    @classmethod
+    def ok(cls, cfg: "AccountConfig", sig: CopySignal, ticket: int) -> "CopyResult":
+        return cls(cfg.name, cfg.login, sig, CopyStatus.SUCCESS, ticket, "")
+
+    @classmethod
+    def fail(cls, cfg: "AccountConfig", sig: CopySignal, msg: str) -> "CopyResult":
+        return cls(cfg.name, cfg.login, sig, CopyStatus.FAILED, None, msg)
+
+    @classmethod
+    def skip(cls, cfg: "AccountConfig", sig: CopySignal, msg: str) -> "CopyResult":
+        return cls(cfg.name, cfg.login, sig, CopyStatus.SKIPPED, None, msg)
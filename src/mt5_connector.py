@@ -4,8 +4,15 @@ Wraps the MetaTrader5 Python library to connect to a specific terminal,
 read positions, and execute trade operations.
 """
 
+import asyncio
+import functools
+import random
+import sys
+import threading
 import time
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     import MetaTrader5 as mt5
@@ -24,38 +31,192 @@ _MT5_POS_TYPE = {
     1: OrderType.SELL,
 }
 
+
+def _mt5_const(name: str, fallback: int) -> int:
+    """MetaTrader5 constant bound once at import (fallback without the package)."""
+    return getattr(mt5, name, fallback) if MT5_AVAILABLE else fallback
+
+
+# Trade constants, resolved here instead of via `mt5.` lookups per order_send
+_ORDER_TYPE_BUY     = _mt5_const("ORDER_TYPE_BUY", 0)
+_ORDER_TYPE_SELL    = _mt5_const("ORDER_TYPE_SELL", 1)
+_TRADE_ACTION_DEAL  = _mt5_const("TRADE_ACTION_DEAL", 1)
+_TRADE_ACTION_SLTP  = _mt5_const("TRADE_ACTION_SLTP", 6)
+_ORDER_TIME_GTC     = _mt5_const("ORDER_TIME_GTC", 0)
+_RC_DONE            = _mt5_const("TRADE_RETCODE_DONE", 10009)
+_RC_REQUOTE         = _mt5_const("TRADE_RETCODE_REQUOTE", 10004)
+# Retcodes meaning "this filling mode isn't accepted, try the next one":
+# TRADE_RETCODE_INVALID_FILL (10030, "invalid order filling type"). MT5
+# documents no separate "unsupported" retcode, so that's the only one
+_RC_BAD_FILL        = frozenset((
+    _mt5_const("TRADE_RETCODE_INVALID_FILL", 10030),
+))
+
 # Filling modes to try in order (brokers vary)
 _FILLING_MODES = [
-    mt5.ORDER_FILLING_IOC if MT5_AVAILABLE else 1,
-    mt5.ORDER_FILLING_FOK if MT5_AVAILABLE else 0,
-    mt5.ORDER_FILLING_RETURN if MT5_AVAILABLE else 2,
+    _mt5_const("ORDER_FILLING_IOC", 1),
+    _mt5_const("ORDER_FILLING_FOK", 0),
+    _mt5_const("ORDER_FILLING_RETURN", 2),
 ]
 
 
+_COPY_PREFIX = "MC-"
+
+# One C-level call pulls every field _to_positions needs from a raw row
+_ROW_FIELDS = attrgetter(
+    "ticket", "symbol", "type", "volume", "price_open", "sl", "tp",
+    "comment", "magic", "profit", "swap", "time",
+)
+
+
+def _master_ticket(comment: str) -> Optional[int]:
+    """Master ticket encoded in a copied position's 'MC-<ticket>' comment."""
+    if comment.startswith(_COPY_PREFIX):
+        suffix = comment[len(_COPY_PREFIX):]
+        if suffix.isdecimal():
+            return int(suffix)
+    return None
+
+
+def _to_positions(raw_positions, point_of: Callable[[str], float]) -> List[Position]:
+    """
+    Decode positions_get() rows in one comprehension, positional arguments
+    in Position field order. Rows of an unknown type are skipped; symbols
+    are interned so the tracker and signals share one string per symbol,
+    and the master ticket of copied positions is parsed here, once.
+    point_of(symbol) supplies the price step used to express SL/TP in points.
+    """
+    pos_type = _MT5_POS_TYPE
+    intern = sys.intern
+    return [
+        Position(
+            ticket, intern(symbol), pos_type[kind], volume, price, sl, tp,
+            comment, magic, profit, swap, opened, _master_ticket(comment),
+            point_of(symbol),
+        )
+        for (ticket, symbol, kind, volume, price, sl, tp,
+             comment, magic, profit, swap, opened) in map(_ROW_FIELDS, raw_positions)
+        if kind in pos_type
+    ]
+
+
+# How long a fetched tick may be reused before asking the terminal again
+_TICK_TTL_NS = 20_000_000  # 20 ms
+
+
+# The MetaTrader5 package binds the whole process to one terminal at a time.
+# Every connector goes through this lock, and _active records which connector
+# currently owns the binding so an already-attached account can skip the login.
+_terminal_lock = threading.RLock()
+_active: Optional["MT5Connector"] = None
+
+
 class ConnectorError(Exception):
     pass
 
 
+# Jitter source for retries: OS entropy, so terminals brought up together
+# never share a sequence
+_jitter = random.SystemRandom()
+
+
+class _JitteredBackoff:
+    """
+    Capped exponential backoff with full jitter: the n-th wait is drawn from
+    uniform(0, min(max_ms, base_ms * 2**n)), so slaves retrying the same
+    broker error don't all come back at the same instant.
+    """
+
+    __slots__ = ("base_ms", "max_ms", "_attempt")
+
+    def __init__(self, base_ms: float, max_ms: float = 2000):
+        self.base_ms = base_ms
+        self.max_ms = max_ms
+        self._attempt = 0
+
+    def next_interval(self) -> float:
+        """Next wait in milliseconds."""
+        cap = min(self.max_ms, self.base_ms * (1 << self._attempt))
+        self._attempt += 1
+        return _jitter.uniform(0, cap)
+
+
 class MT5Connector:
     """
     Handles a single connection to one MT5 terminal.
     Call connect() before any operation, shutdown() after.
+
+    Connectors are meant to be long-lived: connect() is a no-op while this
+    connector still owns the terminal binding, so callers can invoke it every
+    cycle and only pay for the handshake after another account took over or
+    the connection was dropped. Hold `lock` around connect() + the calls that
+    follow so no other thread can switch terminals in between.
+
+    Leaving a `with` block keeps the binding for the next user unless the
+    connector was created with close_on_exit=True. Use `registry.get(config)`
+    to share one connector per account across the process.
     """
 
-    def __init__(self, config: AccountConfig):
+    def __init__(self, config: AccountConfig, close_on_exit: bool = False):
         self.config = config
+        self.close_on_exit = close_on_exit
         self._connected = False
+        # symbol → (tick, monotonic_ns fetched); reset with the connection
+        self._ticks: Dict[str, tuple] = {}
+        # Symbols already put in Market Watch on this connection
+        self._selected: Set[str] = set()
+        # symbol → filling mode the broker last accepted (kept across reconnects)
+        self._preferred_fill: Dict[str, int] = {}
+        # (monotonic_ns, positions, copied) from the last snapshot()
+        self._snapshot_cache: Optional[tuple] = None
+        # symbol → price step; a broker property, kept across reconnects
+        self._points: Dict[str, float] = {}
 
     # ------------------------------------------------------------------
     # Connection management
     # ------------------------------------------------------------------
 
-    def connect(self, timeout_ms: int = 10_000) -> bool:
-        """Initialize a connection to the MT5 terminal."""
+    @property
+    def lock(self) -> threading.RLock:
+        """Process-wide lock guarding the MetaTrader5 terminal binding."""
+        return _terminal_lock
+
+    @property
+    def is_active(self) -> bool:
+        """True while this connector owns the terminal binding."""
+        return self._connected and _active is self
+
+    def connect(self, timeout_ms: int = 10_000, max_attempts: int = 1) -> bool:
+        """
+        Initialize a connection to the MT5 terminal (no-op if already attached).
+        With max_attempts > 1, failed attempts are retried after a jittered
+        exponential backoff (200 ms base, 5 s cap). Meant for startup: the
+        waits happen under the caller's terminal lock if it holds one.
+        """
         if not MT5_AVAILABLE:
             logger.error("MetaTrader5 Python package is not installed. Run: pip install MetaTrader5")
             return False
 
+        backoff = _JitteredBackoff(200, max_ms=5_000)
+        for attempt in range(max_attempts):
+            with _terminal_lock:
+                if self.is_active:
+                    return True
+
+                # Release whichever terminal the process is currently bound to
+                if _active is not None:
+                    _active.shutdown()
+
+                if self._initialize(timeout_ms):
+                    return True
+
+            if attempt + 1 < max_attempts:
+                time.sleep(backoff.next_interval() / 1000)
+        return False
+
+    def _initialize(self, timeout_ms: int) -> bool:
+        global _active
+
         ok = mt5.initialize(
             path=self.config.terminal_path,
             login=self.config.login,
@@ -78,6 +239,7 @@ class MT5Connector:
             return False
 
         self._connected = True
+        _active = self
         logger.debug(
             f"[{self.config.name}] Connected. "
             f"Balance: {info.balance:.2f} {info.currency}  "
@@ -87,9 +249,17 @@ class MT5Connector:
 
     def shutdown(self):
         """Close the connection to the current terminal."""
-        if MT5_AVAILABLE and self._connected:
-            mt5.shutdown()
-        self._connected = False
+        global _active
+
+        with _terminal_lock:
+            if MT5_AVAILABLE and self.is_active:
+                mt5.shutdown()
+            if _active is self:
+                _active = None
+            self._connected = False
+            self._ticks.clear()
+            self._selected.clear()
+            self._snapshot_cache = None
 
     def __enter__(self):
         if not self.connect():
@@ -97,56 +267,93 @@ class MT5Connector:
         return self
 
     def __exit__(self, *_):
-        self.shutdown()
+        if self.close_on_exit:
+            self.shutdown()
+
+    # ------------------------------------------------------------------
+    # Market data
+    # ------------------------------------------------------------------
+
+    def _tick(self, symbol: str, refresh: bool = False):
+        """
+        symbol_info_tick() with a short per-connector cache, so a burst of
+        orders on the same symbol costs one terminal round-trip.
+        Pass refresh=True after a requote to force a fresh price.
+        """
+        now = time.monotonic_ns()
+        if not refresh:
+            cached = self._ticks.get(symbol)
+            if cached is not None and now - cached[1] < _TICK_TTL_NS:
+                return cached[0]
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is not None:
+            self._ticks[symbol] = (tick, now)
+        return tick
+
+    def _point(self, symbol: str) -> float:
+        """symbol_info(symbol).point, fetched once per symbol (0.0 if unknown)."""
+        point = self._points.get(symbol)
+        if point is None:
+            info = mt5.symbol_info(symbol)
+            if info is None:
+                return 0.0  # not cached, try again next time
+            point = self._points[symbol] = info.point
+        return point
+
+    def _fill_order(self, symbol: str) -> List[int]:
+        """Filling modes to try, the one that last worked for symbol first."""
+        preferred = self._preferred_fill.get(symbol)
+        if preferred is None:
+            return _FILLING_MODES
+        return [preferred] + [m for m in _FILLING_MODES if m != preferred]
 
     # ------------------------------------------------------------------
     # Reading state
     # ------------------------------------------------------------------
 
     def get_positions(self) -> List[Position]:
-        """Return all currently open market positions."""
-        if not self._connected:
-            return []
-
-        raw_positions = mt5.positions_get()
-        if raw_positions is None:
-            return []
-
-        result: List[Position] = []
-        for p in raw_positions:
-            order_type = _MT5_POS_TYPE.get(p.type)
-            if order_type is None:
-                continue  # unknown type, skip
-            result.append(Position(
-                ticket=p.ticket,
-                symbol=p.symbol,
-                order_type=order_type,
-                volume=p.volume,
-                open_price=p.price_open,
-                stop_loss=p.sl,
-                take_profit=p.tp,
-                comment=p.comment,
-                magic=p.magic,
-                profit=p.profit,
-                swap=p.swap,
-                open_time=p.time,
-            ))
-        return result
+        """
+        Return all currently open market positions.
+        Raises ConnectorError if the terminal did not answer, so a dropped
+        connection is never mistaken for "every position was closed".
+        """
+        return self.snapshot()[0]
 
     def get_copied_positions(self) -> Dict[int, Position]:
         """
         Return slave positions that were copied by this tool,
         keyed by their master ticket (extracted from comment 'MC-<ticket>').
         """
-        result: Dict[int, Position] = {}
-        for pos in self.get_positions():
-            if pos.comment.startswith("MC-"):
-                try:
-                    master_ticket = int(pos.comment[3:])
-                    result[master_ticket] = pos
-                except ValueError:
-                    pass
-        return result
+        return self.snapshot()[1]
+
+    def snapshot(self, ttl_ms: int = 50) -> Tuple[List[Position], Dict[int, Position]]:
+        """
+        (all positions, copied positions by master ticket) from a single
+        positions_get(). The pair is reused for ttl_ms so back-to-back
+        readers share one round-trip; any trade or shutdown drops it.
+        """
+        now = time.monotonic_ns()
+        cached = self._snapshot_cache
+        if cached is not None and now - cached[0] < ttl_ms * 1_000_000:
+            return cached[1], cached[2]
+
+        positions = _to_positions(self._raw_positions(), self._point)
+        copied = {p.master_ticket: p for p in positions if p.master_ticket is not None}
+        self._snapshot_cache = (now, positions, copied)
+        return positions, copied
+
+    def _raw_positions(self):
+        """positions_get() rows; raises ConnectorError if the terminal didn't answer."""
+        if not self.is_active:
+            raise ConnectorError(f"[{self.config.name}] Not connected")
+
+        raw_positions = mt5.positions_get()
+        if raw_positions is None:
+            err = mt5.last_error()
+            raise ConnectorError(
+                f"[{self.config.name}] positions_get failed – code {err[0]}: {err[1]}"
+            )
+        return raw_positions
 
     # ------------------------------------------------------------------
     # Trade execution
@@ -165,63 +372,68 @@ class MT5Connector:
         Open a market position on this account.
         Returns the ticket number on success, None on failure.
         """
-        if not self._connected:
+        if not self.is_active:
             return None
+        self._snapshot_cache = None  # positions are about to change
 
         symbol = signal.symbol
 
-        # Ensure symbol is visible in Market Watch
-        if not mt5.symbol_select(symbol, True):
-            logger.warning(f"[{self.config.name}] Could not select symbol {symbol}")
+        # Ensure symbol is visible in Market Watch (once per connection)
+        if symbol not in self._selected:
+            if mt5.symbol_select(symbol, True):
+                self._selected.add(symbol)
+            else:
+                logger.warning(f"[{self.config.name}] Could not select symbol {symbol}")
 
-        tick = mt5.symbol_info_tick(symbol)
+        tick = self._tick(symbol)
         if tick is None:
             logger.error(f"[{self.config.name}] No tick data for {symbol}")
             return None
 
         is_buy = signal.order_type.is_buy
         price = tick.ask if is_buy else tick.bid
-        order_type_mt5 = mt5.ORDER_TYPE_BUY if is_buy else mt5.ORDER_TYPE_SELL
+        order_type_mt5 = _ORDER_TYPE_BUY if is_buy else _ORDER_TYPE_SELL
 
         sl = signal.stop_loss if copy_sl else 0.0
         tp = signal.take_profit if copy_tp else 0.0
 
-        for attempt in range(max_retries):
-            for filling in _FILLING_MODES:
-                request = {
-                    "action":        mt5.TRADE_ACTION_DEAL,
-                    "symbol":        symbol,
-                    "volume":        slave_lot,
-                    "type":          order_type_mt5,
-                    "price":         price,
-                    "sl":            sl,
-                    "tp":            tp,
-                    "comment":       signal.slave_comment,
-                    "type_time":     mt5.ORDER_TIME_GTC,
-                    "type_filling":  filling,
-                }
+        # Built once; only price and type_filling change between sends
+        request = {
+            "action":        _TRADE_ACTION_DEAL,
+            "symbol":        symbol,
+            "volume":        slave_lot,
+            "type":          order_type_mt5,
+            "price":         price,
+            "sl":            sl,
+            "tp":            tp,
+            "comment":       signal.slave_comment,
+            "type_time":     _ORDER_TIME_GTC,
+            "type_filling":  0,
+        }
 
+        backoff = _JitteredBackoff(retry_delay_ms)
+        for attempt in range(max_retries):
+            for filling in self._fill_order(symbol):
+                request["type_filling"] = filling
                 result = mt5.order_send(request)
 
                 if result is None:
                     continue
 
-                if result.retcode == mt5.TRADE_RETCODE_DONE:
+                if result.retcode == _RC_DONE:
+                    self._preferred_fill[symbol] = filling
                     return result.order
 
                 # Refresh price and retry on stale price error
-                if result.retcode == mt5.TRADE_RETCODE_REQUOTE:
-                    tick = mt5.symbol_info_tick(symbol)
+                if result.retcode == _RC_REQUOTE:
+                    tick = self._tick(symbol, refresh=True)
                     if tick:
-                        price = tick.ask if is_buy else tick.bid
+                        request["price"] = tick.ask if is_buy else tick.bid
                     continue
 
                 # Invalid fill mode → try next filling mode
-                if result.retcode in (
-                    mt5.TRADE_RETCODE_INVALID_FILL,
-                    mt5.TRADE_RETCODE_UNSUPPORTED,
-                ):
-                    break
+                if result.retcode in _RC_BAD_FILL:
+                    continue
 
                 # Other error — log and retry after delay
                 logger.warning(
@@ -230,7 +442,8 @@ class MT5Connector:
                 )
                 break  # break filling loop, retry attempt
 
-            time.sleep(retry_delay_ms / 1000)
+            if attempt + 1 < max_retries:
+                time.sleep(backoff.next_interval() / 1000)
 
         logger.error(
             f"[{self.config.name}] Failed to open {symbol} after {max_retries} attempts"
@@ -244,55 +457,57 @@ class MT5Connector:
         retry_delay_ms: int = 200,
     ) -> bool:
         """Close an existing position by ticket. Returns True on success."""
-        if not self._connected:
+        if not self.is_active:
             return False
+        self._snapshot_cache = None  # positions are about to change
 
         symbol = slave_position.symbol
         ticket = slave_position.ticket
 
-        tick = mt5.symbol_info_tick(symbol)
+        tick = self._tick(symbol)
         if tick is None:
             logger.error(f"[{self.config.name}] No tick data for {symbol} while closing")
             return False
 
         is_buy = slave_position.order_type == OrderType.BUY
         # To close a BUY we SELL, and vice versa
-        close_type = mt5.ORDER_TYPE_SELL if is_buy else mt5.ORDER_TYPE_BUY
+        close_type = _ORDER_TYPE_SELL if is_buy else _ORDER_TYPE_BUY
         price = tick.bid if is_buy else tick.ask
 
-        for attempt in range(max_retries):
-            for filling in _FILLING_MODES:
-                request = {
-                    "action":        mt5.TRADE_ACTION_DEAL,
-                    "position":      ticket,
-                    "symbol":        symbol,
-                    "volume":        slave_position.volume,
-                    "type":          close_type,
-                    "price":         price,
-                    "comment":       "MC-close",
-                    "type_time":     mt5.ORDER_TIME_GTC,
-                    "type_filling":  filling,
-                }
+        # Built once; only price and type_filling change between sends
+        request = {
+            "action":        _TRADE_ACTION_DEAL,
+            "position":      ticket,
+            "symbol":        symbol,
+            "volume":        slave_position.volume,
+            "type":          close_type,
+            "price":         price,
+            "comment":       "MC-close",
+            "type_time":     _ORDER_TIME_GTC,
+            "type_filling":  0,
+        }
 
+        backoff = _JitteredBackoff(retry_delay_ms)
+        for attempt in range(max_retries):
+            for filling in self._fill_order(symbol):
+                request["type_filling"] = filling
                 result = mt5.order_send(request)
 
                 if result is None:
                     continue
 
-                if result.retcode == mt5.TRADE_RETCODE_DONE:
+                if result.retcode == _RC_DONE:
+                    self._preferred_fill[symbol] = filling
                     return True
 
-                if result.retcode == mt5.TRADE_RETCODE_REQUOTE:
-                    tick = mt5.symbol_info_tick(symbol)
+                if result.retcode == _RC_REQUOTE:
+                    tick = self._tick(symbol, refresh=True)
                     if tick:
-                        price = tick.bid if is_buy else tick.ask
+                        request["price"] = tick.bid if is_buy else tick.ask
                     continue
 
-                if result.retcode in (
-                    mt5.TRADE_RETCODE_INVALID_FILL,
-                    mt5.TRADE_RETCODE_UNSUPPORTED,
-                ):
-                    break
+                if result.retcode in _RC_BAD_FILL:
+                    continue
 
                 logger.warning(
                     f"[{self.config.name}] close_position attempt {attempt + 1} "
@@ -300,7 +515,8 @@ class MT5Connector:
                 )
                 break
 
-            time.sleep(retry_delay_ms / 1000)
+            if attempt + 1 < max_retries:
+                time.sleep(backoff.next_interval() / 1000)
 
         logger.error(f"[{self.config.name}] Failed to close ticket {ticket}")
         return False
@@ -312,11 +528,12 @@ class MT5Connector:
         take_profit: float,
     ) -> bool:
         """Modify the SL/TP of an existing position. Returns True on success."""
-        if not self._connected:
+        if not self.is_active:
             return False
+        self._snapshot_cache = None  # positions are about to change
 
         request = {
-            "action":   mt5.TRADE_ACTION_SLTP,
+            "action":   _TRADE_ACTION_SLTP,
             "position": slave_ticket,
             "sl":       stop_loss,
             "tp":       take_profit,
@@ -328,7 +545,7 @@ class MT5Connector:
             logger.error(f"[{self.config.name}] modify_position got None result")
             return False
 
-        if result.retcode == mt5.TRADE_RETCODE_DONE:
+        if result.retcode == _RC_DONE:
             return True
 
         logger.warning(
@@ -336,3 +553,233 @@ class MT5Connector:
             f"comment={result.comment}"
         )
         return False
+
+
+# ---------------------------------------------------------------------------
+# asyncio front-end
+# ---------------------------------------------------------------------------
+
+class AsyncMT5Connector:
+    """
+    Awaitable wrapper around an MT5Connector for asyncio callers, e.g.
+
+        results = await asyncio.gather(*(conn.open_position(s, lot) for s in basket))
+
+    Each call runs in the loop's default executor and performs connect() +
+    the operation under the terminal lock, so it is safe next to the
+    threaded copier. The MetaTrader5 package still executes one terminal
+    call at a time; what the wrapper buys is that the event loop never
+    blocks on the terminal, and the semaphore caps how many executor
+    threads a large gather() can park on the lock.
+    """
+
+    def __init__(self, connector: MT5Connector, concurrency: int = 4):
+        self.sync = connector
+        self.config = connector.config
+        self._concurrency = concurrency
+        # Created on first use: before 3.10 a Semaphore binds to the loop
+        # that is current when it is constructed
+        self._sem: Optional[asyncio.Semaphore] = None
+
+    async def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._concurrency)
+        call = functools.partial(self._locked, fn, *args, **kwargs)
+        async with self._sem:
+            return await asyncio.get_running_loop().run_in_executor(None, call)
+
+    def _locked(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self.sync.lock:
+            if not self.sync.connect():
+                raise ConnectorError(f"Could not connect to [{self.config.name}]")
+            return fn(*args, **kwargs)
+
+    async def get_positions(self) -> List[Position]:
+        return await self._call(self.sync.get_positions)
+
+    async def get_copied_positions(self) -> Dict[int, Position]:
+        return await self._call(self.sync.get_copied_positions)
+
+    async def open_position(self, signal: CopySignal, slave_lot: float, **kwargs) -> Optional[int]:
+        return await self._call(self.sync.open_position, signal, slave_lot, **kwargs)
+
+    async def close_position(self, slave_position: Position, **kwargs) -> bool:
+        return await self._call(self.sync.close_position, slave_position, **kwargs)
+
+    async def modify_position(self, slave_ticket: int, stop_loss: float, take_profit: float) -> bool:
+        return await self._call(self.sync.modify_position, slave_ticket, stop_loss, take_profit)
+
+    async def shutdown(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.sync.shutdown)
+
+
+# ---------------------------------------------------------------------------
+# Connector registry
+# ---------------------------------------------------------------------------
+
+# Seconds between heartbeat checks of the bound terminal
+_HEARTBEAT_INTERVAL = 30.0
+_HEARTBEAT_RECONNECT_ATTEMPTS = 5
+
+
+class MT5ConnectorRegistry:
+    """
+    One long-lived MT5Connector per (terminal_path, login), shared by the
+    copier, the connection check and the UI probes, so nobody pays for a
+    fresh mt5.initialize() just because they built their own connector.
+
+    The first get() starts a daemon heartbeat that pings the currently bound
+    terminal every 30 s and reconnects it with jittered backoff when it stops
+    answering, instead of leaving the failure to the next trade.
+    """
+
+    def __init__(self, heartbeat_interval: float = _HEARTBEAT_INTERVAL):
+        self.heartbeat_interval = heartbeat_interval
+        self._conns: Dict[tuple, MT5Connector] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def get(self, config: AccountConfig) -> MT5Connector:
+        """Connector for this account, created on first use."""
+        key = (config.terminal_path, config.login)
+        with self._lock:
+            conn = self._conns.get(key)
+            if conn is None or conn.config != config:
+                # New account, or its credentials were edited: start over
+                if conn is not None:
+                    conn.shutdown()
+                conn = self._conns[key] = MT5Connector(config)
+            if self._heartbeat is None:
+                self._start_heartbeat()
+            return conn
+
+    def find(self, config: AccountConfig) -> Optional[MT5Connector]:
+        """The registered connector for this exact config, if any (never creates or replaces one)."""
+        with self._lock:
+            conn = self._conns.get((config.terminal_path, config.login))
+        return conn if conn is not None and conn.config == config else None
+
+    def close_all(self):
+        """Stop the heartbeat and shut down every registered connector."""
+        self._stop.set()
+        with self._lock:
+            for conn in self._conns.values():
+                conn.shutdown()
+            self._conns.clear()
+            self._heartbeat = None
+
+    def _start_heartbeat(self):
+        self._stop.clear()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop,
+            daemon=True,
+            name="MT5Heartbeat",
+        )
+        self._heartbeat.start()
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            with _terminal_lock:
+                conn = _active
+                if conn is None:
+                    continue
+                try:
+                    alive = mt5.account_info() is not None
+                except Exception:
+                    alive = False
+                if alive:
+                    continue
+                logger.warning(f"[{conn.config.name}] Terminal stopped answering, reconnecting…")
+                conn.shutdown()
+            self._reconnect(conn)
+
+    def _reconnect(self, conn: MT5Connector):
+        backoff = _JitteredBackoff(500, max_ms=10_000)
+        for _ in range(_HEARTBEAT_RECONNECT_ATTEMPTS):
+            with _terminal_lock:
+                if _active is not None:
+                    return  # someone else bound a terminal in the meantime
+                if conn.connect():
+                    logger.info(f"[{conn.config.name}] Reconnected")
+                    return
+            if self._stop.wait(backoff.next_interval() / 1000):
+                return
+        logger.error(
+            f"[{conn.config.name}] Could not reconnect after "
+            f"{_HEARTBEAT_RECONNECT_ATTEMPTS} attempts"
+        )
+
+
+registry = MT5ConnectorRegistry()
+
+
+# ---------------------------------------------------------------------------
+# Multi-account fan-out
+# ---------------------------------------------------------------------------
+
+class MultiConnectorPool:
+    """
+    One persistent MT5Connector per account plus a thread pool to fan work
+    out across them.
+
+    Each task runs in its own worker and holds its connector's lock for the
+    whole connect + call sequence, so per-account batches stay ordered while
+    the bookkeeping around the terminal calls of different accounts overlaps.
+    """
+
+    def __init__(self, configs: List[AccountConfig], thread_name_prefix: str = "slave"):
+        self._conns: Dict[int, MT5Connector] = {
+            cfg.login: registry.get(cfg) for cfg in configs
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._conns)),
+            thread_name_prefix=thread_name_prefix,
+        )
+
+    def __getitem__(self, login: int) -> MT5Connector:
+        return self._conns[login]
+
+    def __len__(self) -> int:
+        return len(self._conns)
+
+    def connectors(self) -> List[MT5Connector]:
+        return list(self._conns.values())
+
+    def broadcast(self, fn: Callable[..., Any], *args) -> Iterator[Any]:
+        """
+        Run fn(connector, *args) for every account concurrently and yield
+        the return values as they complete. Exceptions propagate from the
+        iterator, so callers should handle them inside fn.
+        """
+        futures = [
+            self._executor.submit(fn, connector, *args)
+            for connector in self._conns.values()
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+    def snapshot_all(self) -> Dict[int, Optional[Dict[int, Position]]]:
+        """
+        get_copied_positions() for every account, keyed by login.
+        An account that cannot be reached maps to None.
+        """
+        return dict(self.broadcast(_snapshot_copied))
+
+    def close_all(self):
+        """Stop the workers, then shut down every connector."""
+        self._executor.shutdown(wait=True)
+        for connector in self._conns.values():
+            connector.shutdown()
+
+
+def _snapshot_copied(connector: MT5Connector):
+    with connector.lock:
+        try:
+            if not connector.connect():
+                return connector.config.login, None
+            return connector.config.login, connector.get_copied_positions()
+        except Exception as e:
+            logger.debug(f"[{connector.config.name}] Snapshot failed: {e}")
+            return connector.config.login, None
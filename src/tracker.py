@@ -16,6 +16,8 @@ class PositionTracker:
     def __init__(self):
         # ticket → Position
         self._previous: Dict[int, Position] = {}
+        # ticket → Position.signature(), kept so the previous side is built once
+        self._previous_sigs: Dict[int, Tuple] = {}
 
     def compute_signals(
         self,
@@ -28,12 +30,26 @@ class PositionTracker:
         Returns a list of signals describing what changed.
         """
         current_map: Dict[int, Position] = {p.ticket: p for p in current_positions}
-        signals: List[CopySignal] = []
+        previous = self._previous
+        previous_sigs = self._previous_sigs
+        opened: List[CopySignal] = []
+        modified: List[CopySignal] = []
 
-        # --- Detect NEW positions (opened since last poll) ---
+        # --- One pass for NEW and MODIFIED positions ---
+        # The snapshot is updated in place: only tickets whose signature
+        # changed (or that are new) are written.
         for ticket, pos in current_map.items():
-            if ticket not in self._previous:
-                signals.append(CopySignal(
+            sig = pos.signature()
+            prev_sig = previous_sigs.get(ticket)
+            if prev_sig == sig:
+                continue  # nothing tradeable changed
+
+            prev_pos = previous.get(ticket)
+            previous[ticket] = pos
+            previous_sigs[ticket] = sig
+
+            if prev_sig is None:
+                opened.append(CopySignal(
                     signal_type=SignalType.OPEN,
                     master_ticket=ticket,
                     symbol=pos.symbol,
@@ -44,40 +60,44 @@ class PositionTracker:
                     take_profit=pos.take_profit if copy_tp else 0.0,
                     comment=pos.comment,
                 ))
+                continue
 
-        # --- Detect CLOSED positions (gone since last poll) ---
-        for ticket, pos in self._previous.items():
-            if ticket not in current_map:
-                signals.append(CopySignal(
-                    signal_type=SignalType.CLOSE,
+            if sig[4] == prev_sig[4]:
+                sl_changed = copy_sl and sig[2] != prev_sig[2]
+                tp_changed = copy_tp and sig[3] != prev_sig[3]
+            else:
+                # The symbol's point changed (e.g. symbol_info() failed for
+                # one poll), so the step counts are at different scales
+                sl_moved, tp_moved = pos.sl_tp_changes(prev_pos)
+                sl_changed = copy_sl and sl_moved
+                tp_changed = copy_tp and tp_moved
+
+            if sl_changed or tp_changed:
+                modified.append(CopySignal(
+                    signal_type=SignalType.MODIFY,
                     master_ticket=ticket,
                     symbol=pos.symbol,
+                    stop_loss=pos.stop_loss,
+                    take_profit=pos.take_profit,
                 ))
 
-        # --- Detect MODIFIED positions (SL or TP changed) ---
-        for ticket, pos in current_map.items():
-            if ticket in self._previous:
-                prev = self._previous[ticket]
-                sl_changed = copy_sl and abs(pos.stop_loss - prev.stop_loss) > 0.000001
-                tp_changed = copy_tp and abs(pos.take_profit - prev.take_profit) > 0.000001
-
-                if sl_changed or tp_changed:
-                    signals.append(CopySignal(
-                        signal_type=SignalType.MODIFY,
-                        master_ticket=ticket,
-                        symbol=pos.symbol,
-                        stop_loss=pos.stop_loss,
-                        take_profit=pos.take_profit,
-                    ))
-
-        # --- Update the snapshot ---
-        self._previous = current_map
+        # --- Detect CLOSED positions (gone since last poll) ---
+        closed: List[CopySignal] = []
+        for ticket in sorted(previous.keys() - current_map.keys()):
+            del previous_sigs[ticket]
+            closed.append(CopySignal(
+                signal_type=SignalType.CLOSE,
+                master_ticket=ticket,
+                symbol=previous.pop(ticket).symbol,
+            ))
 
-        return signals
+        # Same order as before: opens, then closes, then modifies
+        return opened + closed + modified
 
     def reset(self):
         """Clear the snapshot (useful on reconnect)."""
         self._previous = {}
+        self._previous_sigs = {}
 
     @property
     def known_tickets(self) -> List[int]:
@@ -5,6 +5,7 @@ Changes are saved directly back to accounts.json.
 
 import json
 import os
+import queue
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Callable, Optional, List, Dict, Any
@@ -12,6 +13,35 @@ import threading
 
 import customtkinter as ctk
 
+from src.ui_common import dot_image, get_font
+
+# Resolved once here rather than on every Test click; the test reports
+# the missing package when these are unavailable
+try:
+    from src.models import AccountConfig
+    from src.mt5_connector import MT5Connector
+    import MetaTrader5 as mt5
+    _MT5_OK = True
+except ImportError:
+    _MT5_OK = False
+
+# orjson when installed (faster load/save of accounts.json), stdlib otherwise
+# _serialize is indented for the file on disk (pretty=True), compact otherwise
+try:
+    import orjson
+
+    def _serialize(data, pretty: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+
+    _loads = orjson.loads
+except ImportError:
+    def _serialize(data, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
 # Reuse the palette from ui_app
 C = {
     "bg_deep":    "#0D1117",
@@ -34,40 +64,66 @@ C = {
 }
 FF = "Segoe UI"
 
+# Recurring fonts and colours, built once instead of per widget
+FONT_LABEL   = (FF, 9, "bold")
+FONT_BODY    = (FF, 10)
+FONT_BTN     = (FF, 11)
+FONT_BTN_B   = (FF, 11, "bold")
+FONT_ENTRY   = (FF, 12)
+FONT_ENTRY_B = (FF, 12, "bold")
+
+BG_INPUT = C["bg_input"]
+BORDER   = C["border"]
+TEXT     = C["text"]
+MUTED    = C["muted"]
+MUTED2   = C["muted2"]
+
+# Standard text entry styling
+ENTRY_KW = dict(
+    fg_color=BG_INPUT, border_color=BORDER,
+    text_color=TEXT, placeholder_text_color=MUTED2,
+    height=34, corner_radius=6,
+)
+
 
 # ── Small helper widgets ──────────────────────────────────────────────────────
 
-def _section_label(parent, text: str):
+def _section_label(parent, text: str, row: int, column: int = 0,
+                   columnspan: int = 3):
     ctk.CTkLabel(
         parent, text=text,
-        font=(FF, 9, "bold"),
-        text_color=C["muted"],
+        font=get_font(FONT_LABEL),
+        text_color=MUTED,
         anchor="w",
-    ).pack(fill="x", pady=(12, 2))
+    ).grid(row=row, column=column, columnspan=columnspan,
+           sticky="ew", pady=(12, 2))
 
 
-def _field(parent, label: str, var: tk.StringVar,
+def _field(parent, label: str, var: tk.StringVar, row: int,
            placeholder: str = "", show: str = "") -> ctk.CTkEntry:
-    _section_label(parent, label)
+    """Section label on `row`, full-width entry on the row below."""
+    _section_label(parent, label, row)
     e = ctk.CTkEntry(
         parent,
         textvariable=var,
         placeholder_text=placeholder,
         show=show,
-        fg_color=C["bg_input"],
-        border_color=C["border"],
-        text_color=C["text"],
-        placeholder_text_color=C["muted2"],
-        font=(FF, 12),
-        height=34,
-        corner_radius=6,
+        **ENTRY_KW, font=get_font(FONT_ENTRY),
     )
-    e.pack(fill="x")
+    e.grid(row=row + 1, column=0, columnspan=3, sticky="ew")
     return e
 
 
-def _divider(parent):
-    ctk.CTkFrame(parent, height=1, fg_color=C["border"]).pack(fill="x", pady=(14, 0))
+def _add_bindtag(widget, tag: str):
+    """Prepend `tag` to the bindtags of `widget` and all its descendants."""
+    widget.bindtags((tag,) + widget.bindtags())
+    for child in widget.winfo_children():
+        _add_bindtag(child, tag)
+
+
+def _divider(parent, row: int):
+    ctk.CTkFrame(parent, height=1, fg_color=BORDER).grid(
+        row=row, column=0, columnspan=3, sticky="ew", pady=(14, 0))
 
 
 # ── Account list row ──────────────────────────────────────────────────────────
@@ -80,7 +136,7 @@ class AccountRow(ctk.CTkFrame):
             fg_color=C["bg_card"],
             corner_radius=8,
             border_width=1,
-            border_color=C["border"],
+            border_color=BORDER,
             cursor="hand2",
             **kwargs,
         )
@@ -93,58 +149,79 @@ class AccountRow(ctk.CTkFrame):
         inner.pack(fill="x", padx=10, pady=7)
 
         # Role badge
-        role_color = C["cyan"] if is_master else C["rose"]
-        ctk.CTkLabel(
+        self._badge = ctk.CTkLabel(
             inner,
-            text="MASTER" if is_master else "SLAVE",
-            font=(FF, 8, "bold"),
-            text_color=role_color,
+            text="",
+            font=get_font((FF, 8, "bold")),
             fg_color=C["bg_deep"],
             corner_radius=3,
             width=44,
             height=17,
-        ).pack(side="left", padx=(0, 8))
+        )
+        self._badge.pack(side="left", padx=(0, 8))
 
         # Name + login
         info = ctk.CTkFrame(inner, fg_color="transparent")
         info.pack(side="left", fill="x", expand=True)
 
-        name = account.get("name", f"Account #{account.get('login','?')}")
-        ctk.CTkLabel(
-            info, text=name,
-            font=(FF, 12, "bold"),
-            text_color=C["text"],
+        self._name_lbl = ctk.CTkLabel(
+            info, text="",
+            font=get_font(FONT_ENTRY_B),
+            text_color=TEXT,
             anchor="w",
-        ).pack(fill="x")
-        ctk.CTkLabel(
-            info,
-            text=f"#{account.get('login','')}  ·  {account.get('server','')}",
-            font=(FF, 10),
-            text_color=C["muted"],
+        )
+        self._name_lbl.pack(fill="x")
+        self._sub_lbl = ctk.CTkLabel(
+            info, text="",
+            font=get_font(FONT_BODY),
+            text_color=MUTED,
             anchor="w",
-        ).pack(fill="x")
+        )
+        self._sub_lbl.pack(fill="x")
 
         # Enabled dot
-        dot_color = C["green"] if account.get("enabled", True) else C["muted2"]
-        dot_cv = tk.Canvas(inner, width=8, height=8,
-                           bg=C["bg_card"], highlightthickness=0)
-        dot_cv.pack(side="right")
-        dot_cv.create_oval(0, 0, 8, 8, fill=dot_color, outline="")
-
-        # Click anywhere on the row to select
-        self.bind("<Button-1>", self._clicked)
-        for child in self.winfo_children():
-            child.bind("<Button-1>", self._clicked)
-            for gc in child.winfo_children():
-                gc.bind("<Button-1>", self._clicked)
+        self._dot_lbl = tk.Label(inner, bg=C["bg_card"], bd=0, highlightthickness=0)
+        self._dot_lbl.pack(side="right")
+
+        self.update_account(account, is_master)
+
+        # Click anywhere on the row to select: one class binding on a
+        # row-specific bindtag instead of a bind() per child widget
+        self._tag = f"row{id(self)}"
+        _add_bindtag(self, self._tag)
+        self.bind_class(self._tag, "<Button-1>", self._clicked)
+
+    def update_account(self, account: dict, is_master: bool):
+        """Point the row at `account` and refresh its labels in place."""
+        self._account = account
+        self._is_master = is_master
+
+        self._badge.configure(
+            text="MASTER" if is_master else "SLAVE",
+            text_color=C["cyan"] if is_master else C["rose"],
+        )
+        self._name_lbl.configure(
+            text=account.get("name", f"Account #{account.get('login','?')}")
+        )
+        self._sub_lbl.configure(
+            text=f"#{account.get('login','')}  ·  {account.get('server','')}"
+        )
+        dot_color = C["green"] if account.get("enabled", True) else MUTED2
+        self._dot_lbl.configure(image=dot_image(dot_color, 8))
 
     def _clicked(self, _event=None):
         self._on_select(self._account, self._is_master)
 
+    def destroy(self):
+        self.unbind_class(self._tag, "<Button-1>")
+        super().destroy()
+
     def set_selected(self, selected: bool):
+        if selected == self._selected:
+            return  # avoid a redundant frame redraw
         self._selected = selected
         color = C["cyan_faint"] if selected else C["bg_card"]
-        border = C["cyan"] if selected else C["border"]
+        border = C["cyan"] if selected else BORDER
         self.configure(fg_color=color, border_color=border)
 
 
@@ -154,7 +231,9 @@ class AccountsModal(ctk.CTkToplevel):
     """
     Modal window for managing master & slave accounts.
     Pass an `on_save` callback — it receives (master_raw, slaves_raw, settings)
-    after the user saves.
+    once accounts.json has been written — and optionally `on_save_failed`,
+    which receives the error message when the write fails. Both run on the
+    UI thread, even if the modal was closed while the write was in flight.
     """
 
     def __init__(
@@ -162,10 +241,12 @@ class AccountsModal(ctk.CTkToplevel):
         parent,
         config_path: str,
         on_save: Callable[[dict, list, dict], None],
+        on_save_failed: Optional[Callable[[str], None]] = None,
     ):
         super().__init__(parent)
         self.config_path = config_path
         self.on_save = on_save
+        self.on_save_failed = on_save_failed
 
         self.title("Manage Accounts")
         self.geometry("900x620")
@@ -176,14 +257,21 @@ class AccountsModal(ctk.CTkToplevel):
 
         # Load current config
         self._raw: dict = self._load_raw()
-        self._master_raw: dict = dict(self._raw.get("master", {}))
-        self._slaves_raw: List[dict] = [dict(s) for s in self._raw.get("slaves", [])]
-        self._settings: dict = dict(self._raw.get("settings", {}))
+        self._master_raw: dict = self._raw.get("master", {}).copy()
+        self._slaves_raw: List[dict] = list(map(dict.copy, self._raw.get("slaves", [])))
+        self._settings: dict = self._raw.get("settings", {}).copy()
 
         # Currently edited account
         self._current_account: Optional[dict] = None
         self._current_is_master: bool = False
+        # Role the form was last laid out for (None = never shown)
+        self._last_role: Optional[bool] = None
+        self._form_built = False
+        self._status_after_id: Optional[str] = None
         self._rows: List[AccountRow] = []
+        # id(account dict) → row, reused across _refresh_list calls
+        self._row_pool: Dict[int, AccountRow] = {}
+        self._prev_selected_id: Optional[int] = None
 
         # Form variables
         self._v_name      = tk.StringVar()
@@ -195,31 +283,28 @@ class AccountsModal(ctk.CTkToplevel):
         self._v_lot_value = tk.StringVar(value="1.0")
         self._v_enabled   = tk.BooleanVar(value=True)
 
+        # Opens on the "select an account" placeholder: the edit form is
+        # only built once the user picks an account
         self._build_ui()
 
-        # Auto-select master on open
-        if self._master_raw:
-            self._select_account(self._master_raw, is_master=True)
-
     # ── Raw config I/O ────────────────────────────────────────────────────────
 
     def _load_raw(self) -> dict:
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path) as f:
-                    return json.load(f)
+                # Unbuffered: FileIO.readall sizes one read from fstat
+                with open(self.config_path, "rb", buffering=0) as f:
+                    return _loads(f.read())
             except Exception:
                 pass
         return {"master": {}, "slaves": [], "settings": {}}
 
-    def _write_raw(self):
-        data = {
-            "master":   self._master_raw,
-            "slaves":   self._slaves_raw,
-            "settings": self._settings,
-        }
-        with open(self.config_path, "w") as f:
-            json.dump(data, f, indent=2)
+    def _write_raw(self, payload: bytes):
+        """Atomically replace accounts.json (write a temp file, then rename)."""
+        tmp_path = self.config_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.config_path)
 
     # ── Layout ────────────────────────────────────────────────────────────────
 
@@ -231,7 +316,7 @@ class AccountsModal(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             header, text="Manage Accounts",
-            font=(FF, 15, "bold"), text_color=C["text"],
+            font=get_font((FF, 15, "bold")), text_color=TEXT,
         ).pack(side="left", padx=20, pady=14)
 
         # Save All button
@@ -239,7 +324,7 @@ class AccountsModal(ctk.CTkToplevel):
             header,
             text="💾  Save All",
             width=120, height=32,
-            font=(FF, 12, "bold"),
+            font=get_font(FONT_ENTRY_B),
             fg_color=C["cyan_dim"],
             hover_color=C["cyan"],
             text_color="#000000",
@@ -251,7 +336,7 @@ class AccountsModal(ctk.CTkToplevel):
         # Status label (shows "Saved!" etc.)
         self._status_lbl = ctk.CTkLabel(
             header, text="",
-            font=(FF, 11),
+            font=get_font(FONT_BTN),
             text_color=C["green"],
         )
         self._status_lbl.pack(side="right", padx=(0, 8))
@@ -263,7 +348,7 @@ class AccountsModal(ctk.CTkToplevel):
         body.grid_rowconfigure(0, weight=1)
 
         self._build_list_panel(body)
-        self._build_form_panel(body)
+        self._build_form_shell(body)
 
     # ── Left — account list ───────────────────────────────────────────────────
 
@@ -276,13 +361,13 @@ class AccountsModal(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             pane, text="ACCOUNTS",
-            font=(FF, 9, "bold"),
-            text_color=C["muted"], anchor="w",
+            font=get_font(FONT_LABEL),
+            text_color=MUTED, anchor="w",
         ).grid(row=0, column=0, sticky="w", pady=(0, 6))
 
         self._list_scroll = ctk.CTkScrollableFrame(
             pane, fg_color="transparent",
-            scrollbar_button_color=C["border"],
+            scrollbar_button_color=BORDER,
         )
         self._list_scroll.grid(row=1, column=0, sticky="nsew")
 
@@ -290,11 +375,11 @@ class AccountsModal(ctk.CTkToplevel):
         ctk.CTkButton(
             pane,
             text="＋  Add Slave Account",
-            height=34, font=(FF, 11),
+            height=34, font=get_font(FONT_BTN),
             fg_color=C["bg_card"],
             hover_color=C["bg_hover"],
             border_width=1,
-            border_color=C["border"],
+            border_color=BORDER,
             text_color=C["rose"],
             corner_radius=7,
             command=self._add_slave,
@@ -303,43 +388,60 @@ class AccountsModal(ctk.CTkToplevel):
         self._refresh_list()
 
     def _refresh_list(self):
-        # Clear existing rows
-        for w in self._list_scroll.winfo_children():
-            w.destroy()
-        self._rows.clear()
-
-        # Master row
+        # Desired order: master first, then slaves
+        wanted = []
         if self._master_raw:
-            row = AccountRow(
-                self._list_scroll, self._master_raw, is_master=True,
-                on_select=self._select_account,
-            )
-            row.pack(fill="x", pady=(0, 6))
-            self._rows.append(row)
-
-        # Slave rows
-        for s in self._slaves_raw:
-            row = AccountRow(
-                self._list_scroll, s, is_master=False,
-                on_select=self._select_account,
-            )
-            row.pack(fill="x", pady=(0, 6))
-            self._rows.append(row)
+            wanted.append((self._master_raw, True))
+        wanted.extend((s, False) for s in self._slaves_raw)
+
+        # Drop rows whose account is gone; reuse the rest
+        keep = {id(acc) for acc, _ in wanted}
+        for key in [k for k in self._row_pool if k not in keep]:
+            self._row_pool.pop(key).destroy()
+
+        self._rows.clear()
+        for acc, is_master in wanted:
+            row = self._row_pool.get(id(acc))
+            if row is None:
+                row = self._append_row(acc, is_master)
+            else:
+                row.update_account(acc, is_master)
+                self._rows.append(row)
 
         # Re-highlight selected
-        if self._current_account is not None:
-            for r in self._rows:
-                is_same = (r._account is self._current_account)
-                r.set_selected(is_same)
+        self._highlight(self._current_account)
+
+    def _append_row(self, account: dict, is_master: bool) -> AccountRow:
+        """Create a row for `account` at the bottom of the list."""
+        row = AccountRow(
+            self._list_scroll, account, is_master=is_master,
+            on_select=self._select_account,
+        )
+        # Accounts are only ever appended, so packing at the end
+        # keeps the on-screen order
+        row.pack(fill="x", pady=(0, 6))
+        self._row_pool[id(account)] = row
+        self._rows.append(row)
+        return row
+
+    def _highlight(self, account: Optional[dict]):
+        """Move the selection highlight: touches the old and new rows only."""
+        row = self._row_pool.get(id(account)) if account is not None else None
+        prev = self._row_pool.get(self._prev_selected_id)
+        if prev is not None and prev is not row:
+            prev.set_selected(False)
+        if row is not None:
+            row.set_selected(True)
+        self._prev_selected_id = id(account) if account is not None else None
 
     # ── Right — edit form ─────────────────────────────────────────────────────
 
-    def _build_form_panel(self, parent):
+    def _build_form_shell(self, parent):
         outer = ctk.CTkFrame(
             parent, fg_color=C["bg_card"],
             corner_radius=10,
             border_width=1,
-            border_color=C["border"],
+            border_color=BORDER,
         )
         outer.grid(row=0, column=1, sticky="nsew")
         outer.grid_rowconfigure(0, weight=1)
@@ -347,177 +449,154 @@ class AccountsModal(ctk.CTkToplevel):
 
         self._form_scroll = ctk.CTkScrollableFrame(
             outer, fg_color="transparent",
-            scrollbar_button_color=C["border"],
+            scrollbar_button_color=BORDER,
         )
         self._form_scroll.grid(row=0, column=0, sticky="nsew", padx=20, pady=10)
 
         self._no_selection_lbl = ctk.CTkLabel(
             self._form_scroll,
             text="← Select an account to edit",
-            font=(FF, 13),
-            text_color=C["muted"],
+            font=get_font((FF, 13)),
+            text_color=MUTED,
         )
         self._no_selection_lbl.pack(pady=40)
 
-        # Pre-build form fields (hidden until account selected)
-        self._form_container = ctk.CTkFrame(
+    def _build_form_body(self):
+        """Build the edit form itself; deferred until an account is first selected."""
+        # One grid for the whole form: two equal columns plus a narrow
+        # right-hand column for the 👁 / Browse buttons
+        self._form_container = fc = ctk.CTkFrame(
             self._form_scroll, fg_color="transparent"
         )
+        fc.grid_columnconfigure((0, 1), weight=1, uniform="half")
 
         # Account type badge
         self._form_role_lbl = ctk.CTkLabel(
-            self._form_container,
+            fc,
             text="",
-            font=(FF, 9, "bold"),
+            font=get_font(FONT_LABEL),
             text_color=C["cyan"],
-            fg_color=C["bg_input"],
+            fg_color=BG_INPUT,
             corner_radius=4,
             width=56, height=20,
             anchor="center",
         )
-        self._form_role_lbl.pack(anchor="w", pady=(4, 0))
+        self._form_role_lbl.grid(row=0, column=0, sticky="w", pady=(4, 0))
 
         # ── Credentials section ──────────────────────────────────────────────
-        _section_label(self._form_container, "DISPLAY NAME")
-        _field(self._form_container, "", self._v_name, "e.g. My ICMarkets Account")
-
-        cols = ctk.CTkFrame(self._form_container, fg_color="transparent")
-        cols.pack(fill="x", pady=(0, 0))
-        cols.grid_columnconfigure((0, 1), weight=1)
+        _field(fc, "DISPLAY NAME", self._v_name, 1, "e.g. My ICMarkets Account")
 
-        _section_label(cols, "LOGIN (ACCOUNT NUMBER)")
-        login_e = ctk.CTkEntry(
-            cols, textvariable=self._v_login,
+        _section_label(fc, "LOGIN (ACCOUNT NUMBER)", 3, columnspan=1)
+        _section_label(fc, "SERVER", 3, column=1, columnspan=2)
+        ctk.CTkEntry(
+            fc, textvariable=self._v_login,
             placeholder_text="123456789",
-            fg_color=C["bg_input"], border_color=C["border"],
-            text_color=C["text"], placeholder_text_color=C["muted2"],
-            font=(FF, 12), height=34, corner_radius=6,
-        )
-        login_e.grid(row=1, column=0, sticky="ew", padx=(0, 6))
-
-        _section_label_r = ctk.CTkLabel(
-            cols, text="SERVER",
-            font=(FF, 9, "bold"), text_color=C["muted"], anchor="w",
-        )
-        _section_label_r.grid(row=0, column=1, sticky="w", pady=(12, 2))
-        server_e = ctk.CTkEntry(
-            cols, textvariable=self._v_server,
+            **ENTRY_KW, font=get_font(FONT_ENTRY),
+        ).grid(row=4, column=0, sticky="ew", padx=(0, 6))
+        ctk.CTkEntry(
+            fc, textvariable=self._v_server,
             placeholder_text="ICMarkets-Live01",
-            fg_color=C["bg_input"], border_color=C["border"],
-            text_color=C["text"], placeholder_text_color=C["muted2"],
-            font=(FF, 12), height=34, corner_radius=6,
-        )
-        server_e.grid(row=1, column=1, sticky="ew")
+            **ENTRY_KW, font=get_font(FONT_ENTRY),
+        ).grid(row=4, column=1, columnspan=2, sticky="ew")
 
         # Password
-        _section_label(self._form_container, "PASSWORD")
-        pw_frame = ctk.CTkFrame(self._form_container, fg_color="transparent")
-        pw_frame.pack(fill="x")
-        pw_frame.grid_columnconfigure(0, weight=1)
+        _section_label(fc, "PASSWORD", 5)
         self._pw_entry = ctk.CTkEntry(
-            pw_frame, textvariable=self._v_password,
+            fc, textvariable=self._v_password,
             show="●",
             placeholder_text="Your MT5 password",
-            fg_color=C["bg_input"], border_color=C["border"],
-            text_color=C["text"], placeholder_text_color=C["muted2"],
-            font=(FF, 12), height=34, corner_radius=6,
+            **ENTRY_KW, font=get_font(FONT_ENTRY),
         )
-        self._pw_entry.grid(row=0, column=0, sticky="ew", padx=(0, 8))
+        self._pw_entry.grid(row=6, column=0, columnspan=2, sticky="ew", padx=(0, 8))
         self._show_pw_btn = ctk.CTkButton(
-            pw_frame, text="👁", width=34, height=34,
-            fg_color=C["bg_input"], hover_color=C["bg_hover"],
-            text_color=C["muted"], border_width=1, border_color=C["border"],
-            corner_radius=6, font=(FF, 14),
+            fc, text="👁", width=34, height=34,
+            fg_color=BG_INPUT, hover_color=C["bg_hover"],
+            text_color=MUTED, border_width=1, border_color=BORDER,
+            corner_radius=6, font=get_font((FF, 14)),
             command=self._toggle_password,
         )
-        self._show_pw_btn.grid(row=0, column=1)
+        self._show_pw_btn.grid(row=6, column=2, sticky="w")
 
-        _divider(self._form_container)
+        _divider(fc, 7)
 
         # ── Terminal path ────────────────────────────────────────────────────
-        _section_label(self._form_container, "MT5 TERMINAL PATH")
-        path_frame = ctk.CTkFrame(self._form_container, fg_color="transparent")
-        path_frame.pack(fill="x", pady=(0, 4))
-        path_frame.grid_columnconfigure(0, weight=1)
+        _section_label(fc, "MT5 TERMINAL PATH", 8)
         ctk.CTkEntry(
-            path_frame, textvariable=self._v_path,
+            fc, textvariable=self._v_path,
             placeholder_text="C:\\Program Files\\MetaTrader 5\\terminal64.exe",
-            fg_color=C["bg_input"], border_color=C["border"],
-            text_color=C["text"], placeholder_text_color=C["muted2"],
-            font=(FF, 11), height=34, corner_radius=6,
-        ).grid(row=0, column=0, sticky="ew", padx=(0, 8))
+            fg_color=BG_INPUT, border_color=BORDER,
+            text_color=TEXT, placeholder_text_color=MUTED2,
+            font=get_font(FONT_BTN), height=34, corner_radius=6,
+        ).grid(row=9, column=0, columnspan=2, sticky="ew", padx=(0, 8), pady=(0, 4))
         ctk.CTkButton(
-            path_frame, text="Browse…", width=80, height=34,
-            fg_color=C["bg_input"], hover_color=C["bg_hover"],
-            text_color=C["muted"], border_width=1, border_color=C["border"],
-            corner_radius=6, font=(FF, 11),
+            fc, text="Browse…", width=80, height=34,
+            fg_color=BG_INPUT, hover_color=C["bg_hover"],
+            text_color=MUTED, border_width=1, border_color=BORDER,
+            corner_radius=6, font=get_font(FONT_BTN),
             command=self._browse_path,
-        ).grid(row=0, column=1)
+        ).grid(row=9, column=2, pady=(0, 4))
 
         ctk.CTkLabel(
-            self._form_container,
+            fc,
             text="Each broker account needs its own MT5 terminal installation.",
-            font=(FF, 10), text_color=C["muted"], anchor="w",
-        ).pack(fill="x")
+            font=get_font(FONT_BODY), text_color=MUTED, anchor="w",
+        ).grid(row=10, column=0, columnspan=3, sticky="ew")
 
-        _divider(self._form_container)
+        _divider(fc, 11)
 
         # ── Lot settings (slaves only) ───────────────────────────────────────
-        self._lot_section = ctk.CTkFrame(self._form_container, fg_color="transparent")
-        self._lot_section.pack(fill="x")
+        # Kept as one frame so it can be hidden/shown as a unit
+        self._lot_section = ls = ctk.CTkFrame(fc, fg_color="transparent")
+        self._lot_section.grid(row=12, column=0, columnspan=3, sticky="ew")
+        ls.grid_columnconfigure(2, weight=1)
 
-        _section_label(self._lot_section, "LOT MODE")
-        lot_mode_frame = ctk.CTkFrame(self._lot_section, fg_color="transparent")
-        lot_mode_frame.pack(fill="x")
+        _section_label(ls, "LOT MODE", 0, columnspan=4)
 
         self._lot_mult_btn = ctk.CTkButton(
-            lot_mode_frame, text="Multiplier",
-            height=32, font=(FF, 11),
+            ls, text="Multiplier",
+            height=32, font=get_font(FONT_BTN),
             fg_color=C["cyan_dim"], hover_color=C["cyan"],
             text_color="#000", corner_radius=6,
             command=lambda: self._set_lot_mode("multiplier"),
         )
-        self._lot_mult_btn.pack(side="left", padx=(0, 6))
+        self._lot_mult_btn.grid(row=1, column=0, sticky="w", padx=(0, 6))
 
         self._lot_fixed_btn = ctk.CTkButton(
-            lot_mode_frame, text="Fixed Lot",
-            height=32, font=(FF, 11),
-            fg_color=C["bg_input"], hover_color=C["bg_hover"],
-            text_color=C["muted"], border_width=1, border_color=C["border"],
+            ls, text="Fixed Lot",
+            height=32, font=get_font(FONT_BTN),
+            fg_color=BG_INPUT, hover_color=C["bg_hover"],
+            text_color=MUTED, border_width=1, border_color=BORDER,
             corner_radius=6,
             command=lambda: self._set_lot_mode("fixed"),
         )
-        self._lot_fixed_btn.pack(side="left")
-
-        lot_val_row = ctk.CTkFrame(self._lot_section, fg_color="transparent")
-        lot_val_row.pack(fill="x", pady=(8, 0))
+        self._lot_fixed_btn.grid(row=1, column=1, sticky="w")
 
         self._lot_desc = ctk.CTkLabel(
-            lot_val_row,
+            ls,
             text="Multiplier: slave lot = master lot × value",
-            font=(FF, 10), text_color=C["muted"], anchor="w",
+            font=get_font(FONT_BODY), text_color=MUTED, anchor="w",
         )
-        self._lot_desc.pack(side="left")
+        self._lot_desc.grid(row=2, column=0, columnspan=3, sticky="w", pady=(8, 0))
 
         ctk.CTkEntry(
-            lot_val_row, textvariable=self._v_lot_value,
+            ls, textvariable=self._v_lot_value,
             width=72, height=32,
-            fg_color=C["bg_input"], border_color=C["border"],
-            text_color=C["text"], font=(FF, 12), corner_radius=6,
-        ).pack(side="right")
+            fg_color=BG_INPUT, border_color=BORDER,
+            text_color=TEXT, font=get_font(FONT_ENTRY), corner_radius=6,
+        ).grid(row=2, column=3, sticky="e", pady=(8, 0))
 
-        _divider(self._form_container)
+        _divider(fc, 13)
 
         # ── Enabled toggle + bottom actions ─────────────────────────────────
-        bottom = ctk.CTkFrame(self._form_container, fg_color="transparent")
-        bottom.pack(fill="x", pady=(12, 0))
+        bottom = ctk.CTkFrame(fc, fg_color="transparent")
+        bottom.grid(row=14, column=0, columnspan=3, sticky="ew", pady=(12, 0))
 
         self._enabled_switch = ctk.CTkSwitch(
             bottom,
             text="Account Enabled",
             variable=self._v_enabled,
-            font=(FF, 12),
-            text_color=C["text"],
+            font=get_font(FONT_ENTRY),
+            text_color=TEXT,
             progress_color=C["cyan_dim"],
             button_color=C["cyan"],
             button_hover_color=C["cyan"],
@@ -528,7 +607,7 @@ class AccountsModal(ctk.CTkToplevel):
             bottom,
             text="🗑  Delete",
             width=90, height=32,
-            font=(FF, 11),
+            font=get_font(FONT_BTN),
             fg_color=C["rose_faint"],
             hover_color=C["rose_dim"],
             text_color=C["rose"],
@@ -542,8 +621,8 @@ class AccountsModal(ctk.CTkToplevel):
             bottom,
             text="✓  Apply",
             width=90, height=32,
-            font=(FF, 11, "bold"),
-            fg_color=C["bg_input"],
+            font=get_font(FONT_BTN_B),
+            fg_color=BG_INPUT,
             hover_color=C["cyan_faint"],
             text_color=C["cyan"],
             border_width=1, border_color=C["cyan_faint"],
@@ -557,35 +636,43 @@ class AccountsModal(ctk.CTkToplevel):
             bottom,
             text="⚡ Test",
             width=80, height=32,
-            font=(FF, 11),
-            fg_color=C["bg_input"],
+            font=get_font(FONT_BTN),
+            fg_color=BG_INPUT,
             hover_color=C["bg_hover"],
             text_color=C["yellow"],
-            border_width=1, border_color=C["muted2"],
+            border_width=1, border_color=MUTED2,
             corner_radius=6,
             command=self._test_connection,
         )
         self._test_btn.pack(side="right", padx=(0, 8))
 
         self._test_result_lbl = ctk.CTkLabel(
-            self._form_container, text="",
-            font=(FF, 11), text_color=C["muted"],
+            fc, text="",
+            font=get_font(FONT_BTN), text_color=MUTED,
         )
-        self._test_result_lbl.pack(fill="x", pady=(8, 0))
+        self._test_result_lbl.grid(row=15, column=0, columnspan=3, sticky="ew", pady=(8, 0))
 
     # ── Selection & form population ───────────────────────────────────────────
 
     def _select_account(self, account: dict, is_master: bool):
+        if not self._form_built:
+            self._build_form_body()
+            self._form_built = True
+
         self._current_account = account
         self._current_is_master = is_master
 
         # Update row highlights
-        for row in self._rows:
-            row.set_selected(row._account is account)
+        self._highlight(account)
+
+        # Layout only needs touching when the form is hidden or the role flips
+        relayout = (self._last_role != is_master
+                    or not self._form_container.winfo_ismapped())
 
         # Show form
-        self._no_selection_lbl.pack_forget()
-        self._form_container.pack(fill="both", expand=True)
+        if relayout:
+            self._no_selection_lbl.pack_forget()
+            self._form_container.pack(fill="both", expand=True)
 
         # Populate fields
         self._v_name.set(account.get("name", ""))
@@ -595,7 +682,7 @@ class AccountsModal(ctk.CTkToplevel):
         self._v_path.set(account.get("terminal_path", ""))
         self._v_lot_mode.set(account.get("lot_mode", "multiplier"))
         self._v_lot_value.set(str(account.get("lot_value", "1.0")))
-        self._v_enabled.set(account.get("enabled", True))
+        self._v_enabled.set(bool(account.get("enabled", True)))
 
         # Role badge
         if is_master:
@@ -605,15 +692,18 @@ class AccountsModal(ctk.CTkToplevel):
 
         # Lot section: only show for slaves
         if is_master:
-            self._lot_section.pack_forget()
-            self._enabled_switch.pack_forget()
-            self._delete_btn.configure(state="disabled", text_color=C["muted2"],
-                                       border_color=C["muted2"])
+            if relayout:
+                self._lot_section.grid_remove()
+                self._enabled_switch.pack_forget()
+            self._delete_btn.configure(state="disabled", text_color=MUTED2,
+                                       border_color=MUTED2)
         else:
-            self._lot_section.pack(fill="x")
-            self._enabled_switch.pack(side="left")
+            if relayout:
+                self._lot_section.grid()
+                self._enabled_switch.pack(side="left")
             self._delete_btn.configure(state="normal", text_color=C["rose"],
                                        border_color=C["rose_dim"])
+        self._last_role = is_master
 
         self._set_lot_mode(account.get("lot_mode", "multiplier"), silent=True)
         self._test_result_lbl.configure(text="")
@@ -636,7 +726,7 @@ class AccountsModal(ctk.CTkToplevel):
         except ValueError:
             lot_val = 1.0
 
-        self._current_account.update({
+        new = {
             "name":          self._v_name.get().strip(),
             "login":         login,
             "password":      self._v_password.get(),
@@ -645,8 +735,14 @@ class AccountsModal(ctk.CTkToplevel):
             "lot_mode":      self._v_lot_mode.get(),
             "lot_value":     lot_val,
             "enabled":       bool(self._v_enabled.get()),
-        })
+        }
+        # Nothing edited (e.g. Save All straight after selecting): leave the
+        # list and status alone
+        current = self._current_account
+        if all(current.get(k) == v for k, v in new.items()):
+            return
 
+        current.update(new)
         self._refresh_list()
         self._flash_status("✓ Applied (not saved yet — click Save All)", C["yellow"])
 
@@ -679,22 +775,72 @@ class AccountsModal(ctk.CTkToplevel):
             "lot_value":     1.0,
         }
         self._slaves_raw.append(new_slave)
-        self._refresh_list()
+        self._append_row(new_slave, is_master=False)
         self._select_account(new_slave, is_master=False)
         # Scroll to bottom
         self.after(50, lambda: self._list_scroll._parent_canvas.yview_moveto(1.0))
 
     def _save_all(self):
-        """Apply current form then write entire config to accounts.json."""
+        """
+        Apply current form then write entire config to accounts.json.
+        Serializing happens here; the disk write runs on a worker thread.
+        """
         self._apply_current()
+        data = {
+            "master":   self._master_raw,
+            "slaves":   self._slaves_raw,
+            "settings": self._settings,
+        }
         try:
-            self._write_raw()
+            payload = _serialize(data, pretty=True)
         except Exception as e:
             self._flash_status(f"Save failed: {e}", C["red"])
             return
 
-        # Callback to the main app
-        self.on_save(self._master_raw, self._slaves_raw, self._settings)
+        self._save_btn.configure(state="disabled")
+        # What was written, for on_save: the form may edit the live dicts
+        # before the write finishes
+        saved = (
+            self._master_raw.copy(),
+            list(map(dict.copy, self._slaves_raw)),
+            self._settings.copy(),
+        )
+        # The worker only reports into `done`; the UI thread picks the
+        # result up on the parent's timer, which outlives this modal
+        done: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(
+            target=self._write_raw_bg,
+            args=(payload, done),
+            daemon=True,
+        ).start()
+        self.master.after(50, self._poll_save_done, done, saved)
+
+    def _write_raw_bg(self, payload: bytes, done: queue.SimpleQueue):
+        try:
+            self._write_raw(payload)
+        except Exception as e:
+            done.put(str(e))
+        else:
+            done.put(None)
+
+    def _poll_save_done(self, done: queue.SimpleQueue, saved: tuple):
+        try:
+            error = done.get_nowait()
+        except queue.Empty:
+            self.master.after(50, self._poll_save_done, done, saved)
+            return
+
+        if error is None:
+            self.on_save(*saved)  # callback to the main app
+        elif self.on_save_failed is not None:
+            self.on_save_failed(error)
+
+        if not self.winfo_exists():
+            return  # modal closed while the write was in flight
+        self._save_btn.configure(state="normal")
+        if error is not None:
+            self._flash_status(f"Save failed: {error}", C["red"])
+            return
         self._flash_status("✓  Saved to accounts.json", C["green"])
 
     # ── Password toggle ───────────────────────────────────────────────────────
@@ -721,10 +867,10 @@ class AccountsModal(ctk.CTkToplevel):
         self._v_lot_mode.set(mode)
         if mode == "multiplier":
             self._lot_mult_btn.configure(fg_color=C["cyan_dim"], text_color="#000")
-            self._lot_fixed_btn.configure(fg_color=C["bg_input"], text_color=C["muted"])
+            self._lot_fixed_btn.configure(fg_color=BG_INPUT, text_color=MUTED)
             self._lot_desc.configure(text="slave lot = master lot × value")
         else:
-            self._lot_mult_btn.configure(fg_color=C["bg_input"], text_color=C["muted"])
+            self._lot_mult_btn.configure(fg_color=BG_INPUT, text_color=MUTED)
             self._lot_fixed_btn.configure(fg_color=C["rose_dim"], text_color="#000")
             self._lot_desc.configure(text="Always trade this exact lot size")
         if not silent and self._current_account is not None:
@@ -739,43 +885,53 @@ class AccountsModal(ctk.CTkToplevel):
         self._test_btn.configure(state="disabled", text="Testing…")
         self._test_result_lbl.configure(text="Connecting…", text_color=C["yellow"])
 
-        account = dict(self._current_account)
+        # Hand the worker plain values, not the live dict the form edits
+        acc = self._current_account
         threading.Thread(
             target=self._test_connection_bg,
-            args=(account,),
+            args=(
+                str(acc.get("name", "")),
+                acc.get("login", 0) or 0,
+                str(acc.get("password", "")),
+                str(acc.get("server", "")),
+                str(acc.get("terminal_path", "")),
+            ),
             daemon=True,
         ).start()
 
-    def _test_connection_bg(self, account: dict):
-        try:
-            from src.models import AccountConfig, LotMode
-            from src.mt5_connector import MT5Connector
-            import MetaTrader5 as mt5
-
-            cfg = AccountConfig(
-                name=account.get("name", ""),
-                login=int(account.get("login", 0)),
-                password=str(account.get("password", "")),
-                server=account.get("server", ""),
-                terminal_path=account.get("terminal_path", ""),
-            )
-            conn = MT5Connector(cfg)
-            ok = conn.connect(timeout_ms=8000)
-            if ok:
-                info = mt5.account_info()
-                if info:
+    def _test_connection_bg(self, name: str, login, password: str,
+                            server: str, path: str):
+        if not _MT5_OK:
+            msg = "MetaTrader5 not installed or MT5 terminal not running"
+            color = C["red"]
+        else:
+            try:
+                cfg = AccountConfig(
+                    name=name,
+                    login=int(login),
+                    password=password,
+                    server=server,
+                    terminal_path=path,
+                )
+                # A throwaway connector: the form may hold unsaved edits, so
+                # it mustn't replace the registry's (possibly copier-owned) one
+                conn = MT5Connector(cfg)
+                # Hold the terminal lock from connect() to shutdown(), so the
+                # copier can't rebind the terminal in between and the
+                # balance read is this account's
+                with conn.lock:
+                    ok = conn.connect(timeout_ms=8000)
+                    info = mt5.account_info() if ok else None
+                    conn.shutdown()
+                if not ok:
+                    msg, color = "✗  Connection failed — check credentials and server", C["red"]
+                elif info:
                     msg = f"✓  Connected — balance {info.balance:,.2f} {info.currency}"
                     color = C["green"]
                 else:
                     msg, color = "✓  Connected (no account info)", C["yellow"]
-                conn.shutdown()
-            else:
-                msg, color = "✗  Connection failed — check credentials and server", C["red"]
-        except ImportError:
-            msg = "MetaTrader5 not installed or MT5 terminal not running"
-            color = C["red"]
-        except Exception as e:
-            msg, color = f"✗  Error: {e}", C["red"]
+            except Exception as e:
+                msg, color = f"✗  Error: {e}", C["red"]
 
         self.after(0, lambda: self._test_result_lbl.configure(text=msg, text_color=color))
         self.after(0, lambda: self._test_btn.configure(state="normal", text="⚡ Test"))
@@ -784,4 +940,11 @@ class AccountsModal(ctk.CTkToplevel):
 
     def _flash_status(self, msg: str, color: str):
         self._status_lbl.configure(text=msg, text_color=color)
-        self.after(4000, lambda: self._status_lbl.configure(text=""))
+        # Restart the clear timer rather than stacking one per flash
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self._status_after_id = self.after(4000, self._clear_status)
+
+    def _clear_status(self):
+        self._status_after_id = None
+        self._status_lbl.configure(text="")
@@ -4,17 +4,25 @@ Sleek dark UI with cyan + rose-gold accents.
 """
 
 import queue
+import re
+import sys
 import threading
+import time
 import logging
+import logging.handlers
 import tkinter as tk
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict
 
 import customtkinter as ctk
 
-from src.models import AccountConfig
+from src.models import AccountConfig, LotMode
 from src.config import ConfigError
-from src.logger import setup_logger
+from src.logger import LOG_TAG_KEYS, setup_logger, get_logger
+from src.ui_common import dot_image, get_font
+
+logger = get_logger()
 
 # ── Appearance ────────────────────────────────────────────────────────────────
 ctk.set_appearance_mode("dark")
@@ -44,19 +52,61 @@ C = {
 FONT_FAMILY = "Segoe UI"
 
 
+# Log line → text tag, decided by one regex search; the group that matched
+# (m.lastgroup) is the tag. Branches are tried in order at the leftmost
+# match, so the more specific [MASTER] / → forms come first.
+_TAG_RE = re.compile(
+    r"(?P<open>\[MASTER\].*\sOPEN(?:\s|$))"
+    r"|(?P<close>\[MASTER\].*\sCLOSE)"
+    r"|(?P<modify>\[MASTER\].*\sMODIFY)"
+    r"|(?P<master>\[MASTER\])"
+    r"|(?P<slave_ok>→.*SUCCESS)"
+    r"|(?P<slave_fail>→.*FAILED)"
+    r"|(?P<skipped>→.*SKIPPED)"
+    r"|(?P<arrow>→)",
+    re.IGNORECASE,
+)
+# Tag for lines the regex doesn't claim
+_LEVEL_TAGS = {"ERROR": "error", "WARNING": "warning"}
+
+
 # ── Log queue handler (thread → UI) ──────────────────────────────────────────
 class QueueHandler(logging.Handler):
-    """Puts formatted log records into a queue to be consumed by the UI thread."""
-
-    def __init__(self, log_queue: queue.Queue):
+    """
+    Puts formatted, tagged log lines into a queue to be consumed by the UI
+    thread. It runs on the app's QueueListener thread, so timestamp
+    formatting and tag routing stay off both the logging threads and the UI
+    thread. A record's own `tag` (extra={"tag": ...}, one of LOG_TAG_KEYS)
+    is used as is; only untagged records go through `route(level, msg)`.
+    Each entry is a ready Text.insert chunk: (ts_prefix, "ts", line, tag).
+    It never touches Tk: the UI's own timer picks the lines up.
+    With a bounded queue a full append pushes out the oldest line; `dropped`
+    counts those (it only ever grows, so the reader needn't reset it).
+    """
+
+    def __init__(self, log_queue: deque, route: Callable[[str, str], str]):
         super().__init__()
         self._queue = log_queue
+        self._route = route
+        self.dropped = 0
+        # Records in the same second share one formatted "HH:MM:SS  " prefix
+        self._last_sec = -1
+        self._last_ts = ""
 
     def emit(self, record: logging.LogRecord):
         msg = record.getMessage()
         level = record.levelname
-        ts = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-        self._queue.put_nowait((ts, level, msg))
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_ts = time.strftime("%H:%M:%S  ", time.localtime(sec))
+            self._last_sec = sec
+        tag = getattr(record, "tag", None)
+        if tag not in LOG_TAG_KEYS:
+            tag = self._route(level, msg)
+        log_queue = self._queue
+        if len(log_queue) == log_queue.maxlen:
+            self.dropped += 1
+        log_queue.append((self._last_ts, "ts", msg + "\n", tag))
 
 
 # ── Account card widget ───────────────────────────────────────────────────────
@@ -79,6 +129,7 @@ class AccountCard(ctk.CTkFrame):
             **kwargs,
         )
         self.config = config
+        self.is_master = is_master
         self._status = "disabled" if not config.enabled else "idle"
 
         # Role badge + status dot row
@@ -90,7 +141,7 @@ class AccountCard(ctk.CTkFrame):
         ctk.CTkLabel(
             top,
             text=role_label,
-            font=(FONT_FAMILY, 9, "bold"),
+            font=get_font((FONT_FAMILY, 9, "bold")),
             text_color=role_color,
             fg_color=C["bg_input"],
             corner_radius=4,
@@ -98,72 +149,89 @@ class AccountCard(ctk.CTkFrame):
             height=20,
         ).pack(side="left")
 
-        # Status dot (canvas circle)
-        self._dot_canvas = tk.Canvas(
-            top, width=10, height=10,
-            bg=C["bg_card"], highlightthickness=0,
+        # Status dot (shared circle image)
+        self._dot = tk.Label(
+            top, image=dot_image(C["muted2"], 8),
+            bg=C["bg_card"], borderwidth=0, highlightthickness=0,
         )
-        self._dot_canvas.pack(side="right", padx=(4, 0))
-        self._dot = self._dot_canvas.create_oval(1, 1, 9, 9, fill=C["muted2"], outline="")
+        self._dot.pack(side="right", padx=(4, 0))
 
         self._status_label = ctk.CTkLabel(
             top,
             text="Disabled" if not config.enabled else "Idle",
-            font=(FONT_FAMILY, 10),
+            font=get_font((FONT_FAMILY, 10)),
             text_color=C["muted"],
         )
         self._status_label.pack(side="right", padx=(0, 6))
 
         # Account name
-        ctk.CTkLabel(
+        self._name_label = ctk.CTkLabel(
             self,
             text=config.name,
-            font=(FONT_FAMILY, 13, "bold"),
+            font=get_font((FONT_FAMILY, 13, "bold")),
             text_color=C["text"],
             anchor="w",
-        ).pack(fill="x", padx=14, pady=(6, 0))
+        )
+        self._name_label.pack(fill="x", padx=14, pady=(6, 0))
 
         # Login + server
-        ctk.CTkLabel(
+        self._meta_label = ctk.CTkLabel(
             self,
             text=f"#{config.login}  ·  {config.server}",
-            font=(FONT_FAMILY, 10),
+            font=get_font((FONT_FAMILY, 10)),
             text_color=C["muted"],
             anchor="w",
-        ).pack(fill="x", padx=14)
+        )
+        self._meta_label.pack(fill="x", padx=14)
 
         # Lot badge (slaves only)
+        self._lot_label: Optional[ctk.CTkLabel] = None
         if not is_master:
-            lot_text = (
-                f"Fixed {config.lot_value} lot"
-                if config.lot_mode.value == "fixed"
-                else f"{config.lot_value}× multiplier"
-            )
-            ctk.CTkLabel(
+            self._lot_label = ctk.CTkLabel(
                 self,
-                text=lot_text,
-                font=(FONT_FAMILY, 10),
+                text=self._lot_text(config),
+                font=get_font((FONT_FAMILY, 10)),
                 text_color=C["rose"],
                 fg_color=C["rose_faint"],
                 corner_radius=4,
                 anchor="w",
                 width=1,
-            ).pack(anchor="w", padx=14, pady=(4, 0))
+            )
+            self._lot_label.pack(anchor="w", padx=14, pady=(4, 0))
 
         # Balance row (hidden until connected)
         self._balance_label = ctk.CTkLabel(
             self,
             text="",
-            font=(FONT_FAMILY, 11, "bold"),
+            font=get_font((FONT_FAMILY, 11, "bold")),
             text_color=C["cyan"],
             anchor="w",
         )
         self._balance_label.pack(fill="x", padx=14, pady=(4, 12))
+        self._bal_cache: tuple = (None, None)  # (balance, currency) shown
+
+    @staticmethod
+    def _lot_text(config: AccountConfig) -> str:
+        if config.lot_mode is LotMode.FIXED:
+            return f"Fixed {config.lot_value} lot"
+        return f"{config.lot_value}× multiplier"
+
+    def update_config(self, config: AccountConfig):
+        """Show an edited config for the same account without rebuilding the card."""
+        old, self.config = self.config, config
+        if config.name != old.name:
+            self._name_label.configure(text=config.name)
+        if (config.login, config.server) != (old.login, old.server):
+            self._meta_label.configure(text=f"#{config.login}  ·  {config.server}")
+        if self._lot_label is not None:
+            self._lot_label.configure(text=self._lot_text(config))
+        if config.enabled != old.enabled:
+            self.set_status("idle" if config.enabled else "disabled")
 
     def set_status(self, status: str, balance: Optional[float] = None, currency: str = ""):
         self._status = status
         color = self.STATUS_COLORS.get(status, C["muted2"])
-        self._dot_canvas.itemconfig(self._dot, fill=color)
+        self._dot.configure(image=dot_image(color, 8))
 
         label_map = {
             "idle":      ("Idle",       C["muted"]),
@@ -175,12 +243,15 @@ class AccountCard(ctk.CTkFrame):
         text, text_color = label_map.get(status, ("Unknown", C["muted"]))
         self._status_label.configure(text=text, text_color=text_color)
 
+        # Probes repeat the same balance most ticks: format / configure on change only
         if balance is not None and status == "connected":
-            self._balance_label.configure(
-                text=f"{balance:,.2f} {currency}"
-            )
+            if (balance, currency) != self._bal_cache:
+                self._bal_cache = (balance, currency)
+                self._balance_label.configure(text=f"{balance:,.2f} {currency}")
         elif status in ("idle", "checking", "error"):
-            self._balance_label.configure(text="")
+            if self._bal_cache != (None, None):
+                self._bal_cache = (None, None)
+                self._balance_label.configure(text="")
 
 
 # ── Stats bar item ────────────────────────────────────────────────────────────
@@ -189,18 +260,21 @@ class StatItem(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent", **kwargs)
         self._val_label = ctk.CTkLabel(
             self, text="0",
-            font=(FONT_FAMILY, 22, "bold"),
+            font=get_font((FONT_FAMILY, 22, "bold")),
             text_color=color,
         )
         self._val_label.pack()
+        self._last = 0  # value currently shown
         ctk.CTkLabel(
             self, text=label,
-            font=(FONT_FAMILY, 10),
+            font=get_font((FONT_FAMILY, 10)),
             text_color=C["muted"],
         ).pack()
 
     def set_value(self, value: int):
-        self._val_label.configure(text=str(value))
+        if value != self._last:  # skip the no-op configure between trades
+            self._last = value
+            self._val_label.configure(text=str(value))
 
 
 # ── Main application window ───────────────────────────────────────────────────
@@ -224,9 +298,36 @@ class TradeCopierApp(ctk.CTk):
         self._copier_instance = None
         self._running = False
 
-        # Thread-safe log queue
-        self._log_queue: queue.Queue = queue.Queue()
-        self._event_queue: queue.Queue = queue.Queue()  # account status events
+        # Log pipe: logging threads append, the Tk timer pops; deque
+        # append/popleft are atomic, so no Queue locking is needed. Bounded
+        # so a log flood the UI can't keep up with drops lines, not memory
+        self._log_queue: deque = deque(maxlen=8192)
+        self._log_dropped_seen = 0
+        # Adaptive drain timer: fast while records flow, backs off when idle
+        self._log_idle_count = 0
+        # Log view keeps at most this many lines (oldest trimmed first)
+        self._max_log_lines = 5000
+        self._log_lines = 0
+        # Card status events from the probe worker: (login, status, balance,
+        # currency), coalesced per login on the log timer
+        self._event_queue: deque = deque()
+
+        # Connection probes run on one long-lived worker fed through a queue;
+        # _probe_in_flight stops ticks from stacking behind a slow probe
+        self._probe_in_flight = threading.Event()
+        # Logins the probe has read at least once this run (probe worker;
+        # cleared when the copier starts)
+        self._probe_seen: set = set()
+        self._conn_cmd_q: queue.Queue = queue.Queue()
+        self._conn_worker = threading.Thread(
+            target=self._conn_worker_loop,
+            daemon=True,
+            name="ProbeWorker",
+        )
+        self._conn_worker.start()
+        # Stats / connection timers only run while the copier does
+        self._stats_polling = False
+        self._conn_polling = False
 
         # Wire logger → queue
         self._setup_logging()
@@ -248,10 +349,40 @@ class TradeCopierApp(ctk.CTk):
     # ── Logging bridge ────────────────────────────────────────────────────────
 
     def _setup_logging(self):
+        """
+        Logging threads only enqueue records; a QueueListener thread feeds
+        them to the console handler(s) and to the UI handler, which formats
+        and tags each line for _poll_log_queue.
+        """
         logger = setup_logger(level=self.settings.get("log_level", "INFO"))
-        handler = QueueHandler(self._log_queue)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        logger.addHandler(handler)
+        self._ui_log_handler = QueueHandler(self._log_queue, route=self._route_log_entry)
+        self._ui_log_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        self._log_handlers = list(logger.handlers)
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            record_queue, *self._log_handlers, self._ui_log_handler,
+            respect_handler_level=True,
+        )
+        for h in self._log_handlers:
+            logger.removeHandler(h)
+        self._log_enqueue = logging.handlers.QueueHandler(record_queue)
+        logger.addHandler(self._log_enqueue)
+        self._log_listener.start()
+
+    def _teardown_logging(self):
+        """Stop the listener and give the logger its direct handlers back."""
+        logger = get_logger()
+        logger.removeHandler(self._log_enqueue)
+        # None of the listener's handlers call into Tk, but the Tk thread
+        # still only waits a bounded time for the backlog to flush
+        stopper = threading.Thread(
+            target=self._log_listener.stop, daemon=True, name="LogListenerStop",
+        )
+        stopper.start()
+        stopper.join(timeout=2.0)
+        for h in self._log_handlers:
+            logger.addHandler(h)
 
     # ── Layout ────────────────────────────────────────────────────────────────
 
@@ -282,22 +413,22 @@ class TradeCopierApp(ctk.CTk):
         logo_frame = ctk.CTkFrame(header, fg_color="transparent")
         logo_frame.pack(side="left", padx=20)
 
-        dot = tk.Canvas(logo_frame, width=10, height=10,
-                        bg=C["bg_card"], highlightthickness=0)
-        dot.pack(side="left", pady=24, padx=(0, 8))
-        dot.create_oval(0, 0, 10, 10, fill=C["cyan"], outline="")
+        tk.Label(
+            logo_frame, image=dot_image(C["cyan"]),
+            bg=C["bg_card"], borderwidth=0, highlightthickness=0,
+        ).pack(side="left", pady=24, padx=(0, 8))
 
         ctk.CTkLabel(
             logo_frame,
             text="Trade Copier",
-            font=(FONT_FAMILY, 17, "bold"),
+            font=get_font((FONT_FAMILY, 17, "bold")),
             text_color=C["text"],
         ).pack(side="left")
 
         ctk.CTkLabel(
             logo_frame,
             text="MT5",
-            font=(FONT_FAMILY, 10, "bold"),
+            font=get_font((FONT_FAMILY, 10, "bold")),
             text_color=C["cyan"],
             fg_color=C["cyan_faint"],
             corner_radius=4,
@@ -314,7 +445,7 @@ class TradeCopierApp(ctk.CTk):
             text="⚙  Accounts",
             width=110,
             height=36,
-            font=(FONT_FAMILY, 12),
+            font=get_font((FONT_FAMILY, 12)),
             fg_color=C["bg_input"],
             hover_color=C["bg_hover"],
             text_color=C["muted"],
@@ -327,7 +458,7 @@ class TradeCopierApp(ctk.CTk):
         self._status_pill = ctk.CTkLabel(
             right,
             text="  ●  STOPPED  ",
-            font=(FONT_FAMILY, 11, "bold"),
+            font=get_font((FONT_FAMILY, 11, "bold")),
             text_color=C["muted"],
             fg_color=C["bg_input"],
             corner_radius=20,
@@ -340,7 +471,7 @@ class TradeCopierApp(ctk.CTk):
             text="▶  Start",
             width=110,
             height=36,
-            font=(FONT_FAMILY, 12, "bold"),
+            font=get_font((FONT_FAMILY, 12, "bold")),
             fg_color=C["cyan_dim"],
             hover_color=C["cyan"],
             text_color="#000000",
@@ -363,7 +494,7 @@ class TradeCopierApp(ctk.CTk):
         ctk.CTkLabel(
             sidebar,
             text="ACCOUNTS",
-            font=(FONT_FAMILY, 10, "bold"),
+            font=get_font((FONT_FAMILY, 10, "bold")),
             text_color=C["muted"],
             anchor="w",
         ).pack(fill="x", padx=8, pady=(4, 8))
@@ -406,7 +537,7 @@ class TradeCopierApp(ctk.CTk):
         ctk.CTkLabel(
             log_header,
             text="ACTIVITY LOG",
-            font=(FONT_FAMILY, 10, "bold"),
+            font=get_font((FONT_FAMILY, 10, "bold")),
             text_color=C["muted"],
         ).pack(side="left")
 
@@ -415,7 +546,7 @@ class TradeCopierApp(ctk.CTk):
             text="Clear",
             width=56,
             height=24,
-            font=(FONT_FAMILY, 10),
+            font=get_font((FONT_FAMILY, 10)),
             fg_color=C["bg_input"],
             hover_color=C["bg_hover"],
             text_color=C["muted"],
@@ -461,7 +592,17 @@ class TradeCopierApp(ctk.CTk):
             fg_color=C["bg_card"],
         )
         scrollbar.grid(row=0, column=1, sticky="ns", pady=1, padx=(0, 1))
-        self._log_text.configure(yscrollcommand=scrollbar.set)
+
+        # Tk reports every view change (wheel, keys, scrollbar drag, see())
+        # through yscrollcommand; remember whether the tail is in view there
+        # so inserts don't have to ask with yview()
+        self._log_at_bottom = True
+
+        def _on_log_scroll(first, last):
+            self._log_at_bottom = float(last) >= 0.98
+            scrollbar.set(first, last)
+
+        self._log_text.configure(yscrollcommand=_on_log_scroll)
 
         # Configure text tags
         self._log_text.tag_configure("ts",       foreground=C["muted"],   font=(FONT_FAMILY, 10))
@@ -517,7 +658,7 @@ class TradeCopierApp(ctk.CTk):
         ctk.CTkLabel(
             bar,
             text=f"Poll\n{poll_ms}ms",
-            font=(FONT_FAMILY, 10),
+            font=get_font((FONT_FAMILY, 10)),
             text_color=C["muted"],
         ).grid(row=0, column=4, pady=10)
 
@@ -548,6 +689,7 @@ class TradeCopierApp(ctk.CTk):
 
         # Mark all enabled accounts as "checking"
         self._set_all_cards_status("checking")
+        self._probe_seen.clear()
 
         # Import here to avoid issues if MT5 not installed
         try:
@@ -572,17 +714,17 @@ class TradeCopierApp(ctk.CTk):
             name="CopierThread",
         )
         self._copier_thread.start()
+        self._resume_polling()
 
     def _run_copier_thread(self):
         try:
             self._copier_instance.start()
         except Exception as e:
-            from src.logger import get_logger
-            get_logger().error(f"Copier thread error: {e}")
+            logger.error(f"Copier thread error: {e}")
         finally:
             self._running = False
             # Schedule UI update on main thread
-            self.after(0, self._on_copier_stopped)
+            self.after_idle(self._on_copier_stopped)
 
     def _stop_copier(self):
         if self._copier_instance:
@@ -613,65 +755,143 @@ class TradeCopierApp(ctk.CTk):
 
     def _start_polling(self):
         self._poll_log_queue()
-        self._poll_stats()
-        self._poll_connections()
+        self._resume_polling()
 
     def _poll_log_queue(self):
         """Drain log queue and write entries to the text widget."""
-        try:
-            while True:
-                ts, level, msg = self._log_queue.get_nowait()
-                self._route_log_entry(ts, level, msg)
-        except queue.Empty:
-            pass
-        self.after(80, self._poll_log_queue)
+        log_queue = self._log_queue
+        args: list = []
+        while log_queue:
+            args += log_queue.popleft()  # already (ts, "ts", line, tag)
+        dropped = self._ui_log_handler.dropped - self._log_dropped_seen
+        if dropped:
+            self._log_dropped_seen += dropped
+            args += (
+                time.strftime("%H:%M:%S  "), "ts",
+                f"[logger] {dropped} log messages dropped (UI fell behind)\n",
+                "warning",
+            )
+        count = len(args) // 4
+        if count:
+            self._insert_log(args)
+        if self._event_queue:
+            self._poll_events()
+
+        # 20ms while busy; when idle back off towards 250ms, which bounds
+        # how long the first record after a quiet spell waits
+        if count:
+            self._log_idle_count = 0
+            interval = 20
+        else:
+            self._log_idle_count += 1
+            interval = min(250, 40 * self._log_idle_count)
+        self.after(interval, self._poll_log_queue)
+
+    def _poll_events(self):
+        """Apply queued card updates, only the latest one per account."""
+        event_queue = self._event_queue
+        latest: Dict[str, tuple] = {}
+        while event_queue:
+            event = event_queue.popleft()
+            latest[event[0]] = event
+        for event in latest.values():
+            self._update_card(*event)
+
+    def _resume_polling(self):
+        """Re-arm the stats / connection timers that stopped while idle."""
+        if not self._stats_polling:
+            self._poll_stats()
+        if not self._conn_polling:
+            # First probe one period in, as before, not while the copier
+            # is still bringing its own connections up
+            self._conn_polling = True
+            self.after(5000, self._poll_connections)
 
     def _poll_stats(self):
-        """Refresh the stats bar from the running copier."""
-        if self._copier_instance and self._running:
-            self._stat_opens.set_value(self._copier_instance.total_opens)
-            self._stat_closes.set_value(self._copier_instance.total_closes)
-            self._stat_modifies.set_value(self._copier_instance.total_modifies)
-            self._stat_errors.set_value(self._copier_instance.total_errors)
+        """Refresh the stats bar from the running copier (stops when idle)."""
+        if not (self._copier_instance and self._running):
+            self._stats_polling = False
+            return
+        self._stats_polling = True
+        self._stat_opens.set_value(self._copier_instance.total_opens)
+        self._stat_closes.set_value(self._copier_instance.total_closes)
+        self._stat_modifies.set_value(self._copier_instance.total_modifies)
+        self._stat_errors.set_value(self._copier_instance.total_errors)
         self.after(500, self._poll_stats)
 
     def _poll_connections(self):
         """
         While the copier is running, probe each account periodically
-        and update their cards.
+        and update their cards (stops when idle).
         """
-        if self._running and self._copier_instance:
-            threading.Thread(
-                target=self._check_connections_bg,
-                daemon=True,
-            ).start()
+        if not (self._running and self._copier_instance):
+            self._conn_polling = False
+            return
+        self._conn_polling = True
+        if not self._probe_in_flight.is_set():
+            self._probe_in_flight.set()
+            self._conn_cmd_q.put("probe")
         self.after(5000, self._poll_connections)
 
+    def _conn_worker_loop(self):
+        """Probe worker: runs one probe per queued command, None stops it."""
+        while True:
+            cmd = self._conn_cmd_q.get()
+            if cmd is None:
+                return
+            try:
+                self._check_connections_bg()
+            except Exception as e:
+                logger.debug(f"Connection probe failed: {e}")
+            finally:
+                self._probe_in_flight.clear()
+
     def _check_connections_bg(self):
-        """Background thread: connect to each account and emit status events."""
-        from src.mt5_connector import MT5Connector
+        """Probe worker: check each account and queue its card update as soon as it's known."""
         try:
-            import MetaTrader5 as mt5
+            import MetaTrader5  # noqa: F401
         except ImportError:
             return
 
         for cfg in [self.master_cfg] + [s for s in self.slave_cfgs if s.enabled]:
-            conn = MT5Connector(cfg)
-            try:
-                ok = conn.connect(timeout_ms=4000)
-                if ok:
-                    info = mt5.account_info()
-                    balance = info.balance if info else None
-                    currency = info.currency if info else ""
-                    self.after(0, lambda c=cfg, b=balance, cu=currency: self._update_card(
-                        str(c.login), "connected", b, cu
-                    ))
-                else:
-                    self.after(0, lambda c=cfg: self._update_card(str(c.login), "error"))
-            except Exception:
-                self.after(0, lambda c=cfg: self._update_card(str(c.login), "error"))
-            finally:
-                conn.shutdown()
+            event = self._probe_one(cfg)
+            if event is not None:
+                self._event_queue.append(event)
+
+    def _probe_one(self, cfg: AccountConfig) -> Optional[tuple]:
+        """
+        Read one account's balance off the copier's own connector.
+        Returns (login_key, status, balance, currency), or None to leave
+        the card on its last reading.
+
+        Probes never connect, reconnect or shut anything down: with one
+        terminal binding per process that would stall the copier and throw
+        away its caches. Only the account currently bound is re-queried
+        (a single account_info() under the lock); the others keep their
+        last reading, or show idle until the copier first attaches them.
+        """
+        from src.mt5_connector import registry
+        import MetaTrader5 as mt5
+
+        login_key = str(cfg.login)
+        conn = registry.find(cfg)
+        try:
+            info = None
+            if conn is not None:
+                with conn.lock:
+                    if conn.is_active:
+                        info = mt5.account_info() or False
+        except Exception:
+            info = False
+        if info is None:
+            if login_key in self._probe_seen:
+                return None
+            return login_key, "idle", None, ""
+        self._probe_seen.add(login_key)
+        if info is False:
+            # Bound but not answering; the registry heartbeat reconnects it
+            return login_key, "error", None, ""
+        return login_key, "connected", info.balance, info.currency
 
     def _update_card(self, login_key: str, status: str,
                      balance: Optional[float] = None, currency: str = ""):
@@ -681,45 +901,38 @@ class TradeCopierApp(ctk.CTk):
 
     # ── Log helpers ───────────────────────────────────────────────────────────
 
-    def _route_log_entry(self, ts: str, level: str, msg: str):
-        """Choose the right color tags based on message content."""
-        msg_upper = msg.upper()
-
-        if "[MASTER]" in msg_upper:
-            if " OPEN " in msg_upper or msg_upper.strip().endswith("OPEN"):
-                tag = "open"
-            elif " CLOSE" in msg_upper:
-                tag = "close"
-            elif " MODIFY" in msg_upper:
-                tag = "modify"
-            else:
-                tag = "master"
-        elif "→" in msg or msg.strip().startswith("→"):
-            if "SUCCESS" in msg_upper:
-                tag = "slave_ok"
-            elif "FAILED" in msg_upper:
-                tag = "slave_fail"
-            elif "SKIPPED" in msg_upper:
-                tag = "skipped"
-            else:
-                tag = "arrow"
-        elif level == "ERROR":
-            tag = "error"
-        elif level == "WARNING":
-            tag = "warning"
-        else:
-            tag = "info"
-
-        self._append_log_entry(ts, tag, msg)
+    @staticmethod
+    def _route_log_entry(level: str, msg: str) -> str:
+        """Choose the right color tag based on message content."""
+        m = _TAG_RE.search(msg)
+        if m is not None:
+            return m.lastgroup
+        return _LEVEL_TAGS.get(level, "info")
 
     def _append_log_entry(self, ts: str, tag: str, msg: str):
         """Append a single line to the log text widget."""
+        self._insert_log((f"{ts}  ", "ts", msg + "\n", tag))
+
+    def _insert_log(self, args):
+        """
+        Insert alternating (chars, tag) pairs with a single Text.insert,
+        so a whole drain costs one state flip, one insert and one scroll.
+        """
         self._log_text.configure(state="normal")
-        # Check auto-scroll (are we at the bottom?)
-        at_bottom = self._log_text.yview()[1] >= 0.98
+        # Auto-scroll only if the tail was in view before this insert
+        at_bottom = self._log_at_bottom
 
-        self._log_text.insert("end", f"{ts}  ", "ts")
-        self._log_text.insert("end", msg + "\n", tag)
+        self._log_text.insert("end", *args)
+
+        # Trim the oldest lines once past the cap; the counter (one line per
+        # entry) avoids asking Tk for the line count on every insert
+        self._log_lines += len(args) // 4
+        if self._log_lines > self._max_log_lines:
+            lines = int(self._log_text.index("end-1c").split(".")[0]) - 1
+            excess = lines - self._max_log_lines
+            if excess > 0:
+                self._log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = min(lines, self._max_log_lines)
 
         if at_bottom:
             self._log_text.see("end")
@@ -730,6 +943,7 @@ class TradeCopierApp(ctk.CTk):
         self._log_text.configure(state="normal")
         self._log_text.delete("1.0", "end")
         self._log_text.configure(state="disabled")
+        self._log_lines = 0
 
     # ── Accounts modal ───────────────────────────────────────────────────────
 
@@ -739,18 +953,26 @@ class TradeCopierApp(ctk.CTk):
             parent=self,
             config_path=self.config_path,
             on_save=self._on_accounts_saved,
+            on_save_failed=self._on_accounts_save_failed,
         )
 
     def _on_accounts_saved(self, master_raw: dict, slaves_raw: list, settings: dict):
-        """Called by the modal after the user saves. Reloads configs and rebuilds UI."""
-        from src.config import load_config, ConfigError
+        """
+        Called by the modal once accounts.json is written. Rebuilds the
+        configs from the saved dicts (no need to re-read the file) and the UI.
+        """
+        from src.config import parse_config, ConfigError
 
         was_running = self._running
         if was_running:
             self._stop_copier()
 
         try:
-            new_master, new_slaves, new_settings = load_config(self.config_path)
+            new_master, new_slaves, new_settings = parse_config({
+                "master":   master_raw,
+                "slaves":   slaves_raw,
+                "settings": settings,
+            })
         except ConfigError as e:
             self._append_log_entry(
                 datetime.now().strftime("%H:%M:%S"),
@@ -768,27 +990,61 @@ class TradeCopierApp(ctk.CTk):
             "info", "Accounts updated and saved.",
         )
 
-    def _rebuild_account_cards(self):
-        """Destroy and recreate all account cards in the sidebar."""
-        # Find the scrollable list frame and clear it
-        for widget in self._list_scroll.winfo_children():
-            widget.destroy()
-        self._account_cards.clear()
+    def _on_accounts_save_failed(self, error: str):
+        """Called by the modal when writing accounts.json failed; configs are left as they were."""
+        self._append_log_entry(
+            datetime.now().strftime("%H:%M:%S"),
+            "error", f"Saving accounts failed: {error}",
+        )
 
-        # Rebuild master card
-        card = AccountCard(self._list_scroll, self.master_cfg, is_master=True)
-        card.pack(fill="x", pady=(0, 8))
-        self._account_cards[str(self.master_cfg.login)] = card
+    def _rebuild_account_cards(self):
+        """
+        Bring the sidebar in line with the current configs: cards of removed
+        accounts are destroyed, kept ones are updated in place and only new
+        accounts get a new card.
+        """
+        wanted = [(self.master_cfg, True)] + [
+            (s, False) for s in self.slave_cfgs if s.enabled
+        ]
+        roles = {str(cfg.login): is_master for cfg, is_master in wanted}
+
+        # Detach the list while it is rebuilt so the cards are laid out in
+        # one geometry pass when it is re-packed, not once per card
+        self._list_scroll.pack_forget()
+
+        # Drop cards for accounts that are gone (or switched master/slave)
+        old_cards = self._account_cards
+        for key, card in list(old_cards.items()):
+            if roles.get(key) != card.is_master:
+                card.destroy()
+                del old_cards[key]
+
+        cards: Dict[str, AccountCard] = {}
+        for cfg, is_master in wanted:
+            key = str(cfg.login)
+            card = old_cards.get(key)
+            if card is None:
+                card = AccountCard(self._list_scroll, cfg, is_master=is_master)
+            else:
+                card.update_config(cfg)
+                card.pack_forget()
+            cards[key] = card
 
-        # Rebuild slave cards
-        for sc in [s for s in self.slave_cfgs if s.enabled]:
-            card = AccountCard(self._list_scroll, sc, is_master=False)
+        # Re-pack in config order
+        for card in cards.values():
             card.pack(fill="x", pady=(0, 8))
-            self._account_cards[str(sc.login)] = card
+        self._account_cards = cards
+
+        self._list_scroll.pack(fill="both", expand=True)
 
     # ── Clean shutdown ────────────────────────────────────────────────────────
 
     def on_close(self):
         if self._running:
             self._stop_copier()
+        self._conn_cmd_q.put(None)
+        # Release whatever the registry still holds and stop its heartbeat
+        if "src.mt5_connector" in sys.modules:
+            sys.modules["src.mt5_connector"].registry.close_all()
+        self._teardown_logging()
         self.destroy()
@@ -0,0 +1,33 @@
+"""
+Shared helpers for the customtkinter UI modules.
+"""
+
+import functools
+import tkinter as tk
+
+import customtkinter as ctk
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(spec: tuple) -> ctk.CTkFont:
+    """
+    One shared CTkFont per (family, size[, weight]) spec, so widgets across
+    the main window and the accounts modal reuse the same Tk font. Needs a
+    Tk root, hence built on first use rather than at import.
+    """
+    family, size, *weight = spec
+    return ctk.CTkFont(family=family, size=size, weight=weight[0] if weight else "normal")
+
+
+@functools.lru_cache(maxsize=None)
+def dot_image(color: str, size: int = 10) -> tk.PhotoImage:
+    """
+    Filled `size`×`size` circle in `color`, drawn once and shared by every
+    status dot. Shown in a plain tk.Label, so a dot needs no Canvas.
+    """
+    img = tk.PhotoImage(width=size, height=size)
+    r = size / 2
+    for y in range(size):
+        half = (r * r - (y + 0.5 - r) ** 2) ** 0.5
+        img.put(color, to=(round(r - half), y, round(r + half), y + 1))
+    return img